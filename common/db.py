@@ -1,23 +1,122 @@
 # db.py
 
+import atexit
+import operator
+import queue
+import threading
 import jaydebeapi
 from contextlib import contextmanager
 from config import JDBC_URL, DB_USER, DB_PASSWORD, DRIVER_CLASS, DRIVER_PATH
 
 class Database:
     """
-    Encapsulates a single JDBC connection. Provides context-manager
-    cursors and high-level methods for SELECT/INSERT/UPDATE/DELETE
-    and stored-procedure calls. Does NOT enforce a singleton—caller
-    is responsible for instantiating exactly one or more as needed.
+    Encapsulates a small pool of JDBC connections (one by default).
+    Provides context-manager cursors and high-level methods for
+    SELECT/INSERT/UPDATE/DELETE and stored-procedure calls. Does NOT
+    enforce a singleton—caller is responsible for instantiating
+    exactly one or more as needed.
+
+    With pool_size > 1, connections beyond the first are opened lazily
+    and each query/update borrows one for its duration, so concurrent
+    callers do not serialize on a single connection.
+
+    With reuse=True the instance borrows a process-wide connection
+    instead of opening its own, so repeated main() calls in one
+    interpreter skip the JVM/JDBC connect. close() then leaves the
+    shared connection open; it is closed at interpreter exit.
     """
 
-    def __init__(self):
+    _shared_conn = None
+
+    def __init__(self, reuse: bool = False, pool_size: int = 1):
+        """
+        Open the first JDBC connection upon instantiation.
+        """
+        self._reuse = reuse
+        self._pool_size = 1 if reuse else max(1, pool_size)
+        self._pool = queue.LifoQueue(maxsize=self._pool_size)
+        self._pool_lock = threading.Lock()
+        if reuse:
+            self._conn = Database._get_shared_connection()
+        else:
+            self._conn = Database._connect()
+        # Every connection this instance opened, idle or borrowed, for close()
+        self._conns = [self._conn]
+        self._closed = False
+        self._pool.put_nowait(self._conn)
+        # connection -> {sql: java.sql.PreparedStatement}, see prepare(). Keyed
+        # by the connection object itself so a reconnect never reuses its entries
+        self._statements = {}
+
+    def acquire(self):
+        """
+        Borrow a connection from the pool, opening a new one while the
+        pool is below pool_size, otherwise waiting for one to be released.
+        Raises RuntimeError once the instance has been closed.
+        """
+        self._check_open()
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                self._check_open()
+                can_open = len(self._conns) < self._pool_size
+                if can_open:
+                    self._conns.append(None)  # reserve the slot while connecting
+            if can_open:
+                try:
+                    conn = Database._connect()
+                except Exception:
+                    with self._pool_lock:
+                        if None in self._conns:
+                            self._conns.remove(None)
+                    raise
+                with self._pool_lock:
+                    if not self._closed:
+                        self._conns[self._conns.index(None)] = conn
+                        return conn
+                conn.close()
+                self._check_open()
+            conn = self._pool.get()
+        if conn is None:
+            # close() wakes waiting callers with None; pass it on to the next one
+            self._pool.put_nowait(None)
+            self._check_open()
+        return conn
+
+    def release(self, conn):
+        """
+        Return a borrowed connection to the pool, or drop it (closing it
+        unless it is the shared connection) if the instance was closed.
+        """
+        if self._closed:
+            if not self._reuse:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            return
+        self._pool.put_nowait(conn)
+
+    def _check_open(self):
+        if self._closed:
+            raise RuntimeError("Database is closed")
+
+    @contextmanager
+    def connection(self):
         """
-        Open the JDBC connection upon instantiation.
+        Borrow a pooled connection for the duration of the block.
         """
+        conn = self.acquire()
         try:
-            self._conn = jaydebeapi.connect(
+            yield conn
+        finally:
+            self.release(conn)
+
+    @staticmethod
+    def _connect():
+        try:
+            return jaydebeapi.connect(
                 DRIVER_CLASS,
                 JDBC_URL,
                 [DB_USER, DB_PASSWORD],
@@ -26,19 +125,58 @@ class Database:
         except jaydebeapi.DatabaseError as e:
             raise RuntimeError(f"Failed to connect via JDBC: {e}")
 
+    @classmethod
+    def _get_shared_connection(cls):
+        """
+        Return the process-wide connection, reconnecting if the driver
+        dropped it while idle (e.g. between interactive prompts).
+        """
+        conn = cls._shared_conn
+        if conn is not None:
+            try:
+                if conn.jconn.isValid(5):
+                    return conn
+            except Exception:
+                pass
+            try:
+                conn.close()
+            except Exception:
+                pass
+        cls._shared_conn = cls._connect()
+        return cls._shared_conn
+
+    @classmethod
+    def close_shared(cls):
+        """
+        Close the process-wide connection, if one was opened.
+        """
+        if cls._shared_conn is not None:
+            try:
+                cls._shared_conn.close()
+            finally:
+                cls._shared_conn = None
+
     @contextmanager
     def cursor(self):
         """
         Provide a cursor as a context manager, so it automatically
-        closes even if exceptions happen.
+        closes (and its connection returns to the pool) even if
+        exceptions happen.
         Usage:
             with db.cursor() as cur:
                 cur.execute(SQL, params)
                 rows = cur.fetchall()
         """
+        with self.connection() as conn:
+            with self._cursor(conn) as cur:
+                yield cur
+
+    @staticmethod
+    @contextmanager
+    def _cursor(conn):
         cur = None
         try:
-            cur = self._conn.cursor()
+            cur = conn.cursor()
             yield cur
         finally:
             if cur:
@@ -55,32 +193,149 @@ class Database:
                 cur.execute(sql)
             return cur.fetchall()
 
+    def query_column(self, sql: str, params: list = None, col: int = 0, batch_size: int = 1000) -> list:
+        """
+        Execute a SELECT statement and return only the values of one column.
+        Rows are streamed in batches via fetchmany, so the full rowset is
+        never materialized.
+        """
+        values = []
+        get_col = operator.itemgetter(col)
+        with self.cursor() as cur:
+            if params:
+                cur.execute(sql, params)
+            else:
+                cur.execute(sql)
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                values.extend(map(get_col, rows))
+        return values
+
+    def prepare(self, conn, sql: str):
+        """
+        Return a java.sql.PreparedStatement for sql on the given pooled
+        connection, preparing it only on first use so the server-side
+        parse/plan is reused across calls.
+        """
+        statements = self._statements.setdefault(conn, {})
+        stmt = statements.get(sql)
+        if stmt is None:
+            stmt = statements[sql] = conn.jconn.prepareStatement(sql)
+        return stmt
+
+    def query_column_prepared(self, sql: str, params: list = None, col: int = 0,
+                              fetch_size: int = 256) -> list:
+        """
+        Execute a SELECT through a cached prepared statement and return
+        one column of string values. Rows are read one at a time from the
+        ResultSet (fetch_size rows per network round trip), so no row
+        tuples are built for the other columns.
+        """
+        values = []
+        with self.connection() as conn:
+            stmt = self.prepare(conn, sql)
+            stmt.clearParameters()
+            stmt.setFetchSize(fetch_size)
+            for i, param in enumerate(params or (), 1):
+                stmt.setObject(i, param)
+            rs = stmt.executeQuery()
+            try:
+                while rs.next():
+                    value = rs.getString(col + 1)
+                    values.append(None if value is None else str(value))
+            finally:
+                rs.close()
+        return values
+
     def update(self, sql: str, params: list = None) -> int:
         """
         Execute an INSERT / UPDATE / DELETE. Return number of affected rows.
         """
-        with self.cursor() as cur:
+        with self.connection() as conn, self._cursor(conn) as cur:
             if params:
                 cur.execute(sql, params)
             else:
                 cur.execute(sql)
-            self._conn.commit()
+            conn.commit()
+            return cur.rowcount
+
+    def update_many(self, sql: str, seq_of_params: list) -> int:
+        """
+        Execute an INSERT / UPDATE / DELETE once per parameter list as a
+        single JDBC batch with one commit. Return number of affected rows.
+        """
+        if not seq_of_params:
+            return 0
+        with self.connection() as conn, self._cursor(conn) as cur:
+            cur.executemany(sql, seq_of_params)
+            conn.commit()
             return cur.rowcount
 
+    def update_many_prepared(self, sql: str, seq_of_params: list) -> int:
+        """
+        Like update_many, but binds the parameter lists onto a cached
+        prepared statement (see prepare()), so repeated batches of the
+        same statement skip the parse. Return number of affected rows.
+        """
+        if not seq_of_params:
+            return 0
+        with self.connection() as conn:
+            stmt = self.prepare(conn, sql)
+            stmt.clearBatch()
+            for params in seq_of_params:
+                for i, param in enumerate(params, 1):
+                    stmt.setObject(i, param)
+                stmt.addBatch()
+            counts = stmt.executeBatch()
+            conn.commit()
+        return sum(count for count in counts if count > 0)
+
     def callproc(self, proc_name: str, params: list = None):
         """
         Call a stored procedure. If params is None, calls without arguments.
         """
-        with self.cursor() as cur:
+        with self.connection() as conn, self._cursor(conn) as cur:
             if params:
                 cur.callproc(proc_name, params)
             else:
                 cur.callproc(proc_name, [])
-            self._conn.commit()
+            conn.commit()
 
     def close(self):
         """
-        Close the underlying JDBC connection.
+        Close every JDBC connection this instance opened, including ones
+        still borrowed from the pool. Shared connections stay open for
+        the next Database(reuse=True). The instance can't be used after
+        this: acquire() raises and release() closes instead of pooling.
         """
-        if hasattr(self, '_conn') and self._conn:
-            self._conn.close()
+        if not hasattr(self, '_pool'):
+            return
+        with self._pool_lock:
+            self._closed = True
+        for statements in getattr(self, '_statements', {}).values():
+            for stmt in statements.values():
+                try:
+                    stmt.close()
+                except Exception:
+                    pass
+        self._statements = {}
+        with self._pool_lock:
+            conns = [] if self._reuse else [conn for conn in self._conns if conn is not None]
+            self._conns = []
+        while True:
+            try:
+                self._pool.get_nowait()
+            except queue.Empty:
+                break
+        # Wake any caller blocked in acquire() so it raises instead of waiting forever
+        self._pool.put_nowait(None)
+        for conn in conns:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+
+atexit.register(Database.close_shared)
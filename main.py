@@ -4,19 +4,25 @@ Main CLI application entry point for path analysis system.
 """
 
 import argparse
+import functools
+import itertools
 import sys
-import uuid
 from datetime import datetime
 from typing import Optional
 
 from enums import Approach, Method, RunStatus
-from models import RunConfig, RunResult
-from services.run_service import RunService
-from services.path_service import PathService
-from services.coverage_service import CoverageService
-from db import Database
+from models import RunConfig, RunResult, new_run_id
 
 
+# Allowed method names per approach
+_RANDOM_METHODS = frozenset({'SIMPLE', 'STRATIFIED'})
+_SCENARIO_METHODS = frozenset({'PREDEFINED', 'SYNTHETIC'})
+
+# Enum value -> member lookups, bypassing EnumMeta.__call__
+_APPROACH_MAP = {a.value: a for a in Approach}
+_METHOD_MAP = {m.value: m for m in Method}
+
+@functools.lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
     """Create command line argument parser."""
     parser = argparse.ArgumentParser(
@@ -73,53 +79,64 @@ def validate_method(approach: Approach, method: Optional[str]) -> Method:
     """Validate and return the appropriate method for the given approach."""
     if approach == Approach.RANDOM:
         if method is None:
-            return Method.SIMPLE
-        if method.upper() not in ['SIMPLE', 'STRATIFIED']:
-            raise ValueError(f"Invalid method '{method}' for RANDOM approach. Use SIMPLE or STRATIFIED.")
-        return Method(method.upper())
+            result = Method.SIMPLE
+        else:
+            method_upper = method.upper()
+            if method_upper not in _RANDOM_METHODS:
+                raise ValueError(f"Invalid method '{method}' for RANDOM approach. Use SIMPLE or STRATIFIED.")
+            result = _METHOD_MAP[method_upper]
     
     elif approach == Approach.SCENARIO:
         if method is None:
-            return Method.PREDEFINED
-        if method.upper() not in ['PREDEFINED', 'SYNTHETIC']:
-            raise ValueError(f"Invalid method '{method}' for SCENARIO approach. Use PREDEFINED or SYNTHETIC.")
-        return Method(method.upper())
+            result = Method.PREDEFINED
+        else:
+            method_upper = method.upper()
+            if method_upper not in _SCENARIO_METHODS:
+                raise ValueError(f"Invalid method '{method}' for SCENARIO approach. Use PREDEFINED or SYNTHETIC.")
+            result = _METHOD_MAP[method_upper]
     
     else:
         raise ValueError(f"Unknown approach: {approach}")
+    
+    return result
 
 
 def print_run_summary(result: RunResult, verbose: bool = False):
     """Print run summary to console."""
-    print(f"\n{'='*60}")
-    print(f"RUN SUMMARY")
-    print(f"{'='*60}")
-    print(f"Run ID: {result.run_id}")
-    print(f"Approach: {result.approach.value}")
-    print(f"Method: {result.method.value}")
-    print(f"Fab: {result.fab}")
-    print(f"Tag: {result.tag}")
-    print(f"Status: {result.status.value}")
-    print(f"Duration: {result.duration:.2f}s")
-    print(f"\nCOVERAGE RESULTS:")
-    print(f"Target Coverage: {result.coverage_target:.1%}")
-    print(f"Achieved Coverage: {result.total_coverage:.1%}")
-    print(f"Total Nodes: {result.total_nodes:,}")
-    print(f"Total Links: {result.total_links:,}")
+    lines = [
+        "",
+        "=" * 60,
+        "RUN SUMMARY",
+        "=" * 60,
+        f"Run ID: {result.run_id}",
+        f"Approach: {result.approach_str}",
+        f"Method: {result.method_str}",
+        f"Fab: {result.fab}",
+        f"Tag: {result.tag}",
+        f"Status: {result.status.value}",
+        f"Duration: {result.duration:.2f}s",
+        "",
+        "COVERAGE RESULTS:",
+        f"Target Coverage: {result.coverage_target:.1%}",
+        f"Achieved Coverage: {result.total_coverage:.1%}",
+        f"Total Nodes: {result.total_nodes:,}",
+        f"Total Links: {result.total_links:,}",
+    ]
     
     if verbose and result.errors:
-        print(f"\nERRORS ({len(result.errors)}):")
-        for error in result.errors[:10]:  # Show first 10 errors
-            print(f"  - {error}")
+        lines.append(f"\nERRORS ({len(result.errors)}):")
+        lines.extend(f"  - {error}" for error in itertools.islice(result.errors, 10))  # Show first 10 errors
         if len(result.errors) > 10:
-            print(f"  ... and {len(result.errors) - 10} more errors")
+            lines.append(f"  ... and {len(result.errors) - 10} more errors")
     
     if verbose and result.review_flags:
-        print(f"\nREVIEW FLAGS ({len(result.review_flags)}):")
-        for flag in result.review_flags[:5]:  # Show first 5 flags
-            print(f"  - {flag}")
+        lines.append(f"\nREVIEW FLAGS ({len(result.review_flags)}):")
+        lines.extend(f"  - {flag}" for flag in itertools.islice(result.review_flags, 5))  # Show first 5 flags
         if len(result.review_flags) > 5:
-            print(f"  ... and {len(result.review_flags) - 5} more flags")
+            lines.append(f"  ... and {len(result.review_flags) - 5} more flags")
+    
+    # One write for the whole block instead of one print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -129,7 +146,7 @@ def main():
     
     try:
         # Validate inputs
-        approach = Approach(args.approach)
+        approach = _APPROACH_MAP[args.approach]
         method = validate_method(approach, args.method)
         
         if not (0.0 < args.coverage_target <= 1.0):
@@ -137,7 +154,7 @@ def main():
         
         # Create run configuration
         config = RunConfig(
-            run_id=str(uuid.uuid4()),
+            run_id=new_run_id(),
             approach=approach,
             method=method,
             coverage_target=args.coverage_target,
@@ -155,6 +172,12 @@ def main():
             print(f"  Fab: {config.fab}")
             print(f"  Tag: {config.tag}")
         
+        # Deferred so --help and argument errors exit without loading the JDBC bridge
+        from services.run_service import RunService
+        from services.path_service import PathService
+        from services.coverage_service import CoverageService
+        from db import Database
+        
         # Initialize database and services
         db = Database()
         try:
@@ -2,13 +2,14 @@
 Data models for the path analysis system.
 """
 
+import functools
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from enums import Approach, Method, RunStatus, ObjectType, Severity, ErrorType
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RunConfig:
     """Configuration for a single analysis run."""
     run_id: str
@@ -48,23 +49,29 @@ class RunConfig:
         if date is None:
             date = datetime.now()
         
-        coverage_target_tag = f'{coverage_target*100:.0f}P'
-        
-        # Base tag: YYYYMMDD_APPROACH_METHOD_COVERAGEP
-        tag = f"{date.strftime('%Y%m%d')}_{approach.value}_{method.value}_{coverage_target_tag}"
-        
-        # Add fab if not empty
-        if fab:
-            tag += f"_{fab}"
-        
-        # Add toolset if not empty and not "ALL"
-        if toolset and toolset != "ALL":
-            tag += f"_{toolset}"
-        
-        return tag
+        return _build_tag(approach.value, method.value, coverage_target, fab, toolset,
+                          date.year, date.month, date.day)
+
 
+@functools.lru_cache(maxsize=256)
+def _build_tag(approach: str, method: str, coverage_target: float, fab: str, toolset: str,
+               year: int, month: int, day: int) -> str:
+    """Build a run tag; memoized so repeated runs with the same settings on the same day reuse it."""
+    # Base tag: YYYYMMDD_APPROACH_METHOD_COVERAGEP (integer formatting, no strftime/locale lookup)
+    parts = [f"{year:04d}{month:02d}{day:02d}", approach, method, f"{round(coverage_target * 100)}P"]
+    
+    # Add fab if not empty
+    if fab:
+        parts.append(fab)
+    
+    # Add toolset if not empty and not "ALL"
+    if toolset and toolset != "ALL":
+        parts.append(toolset)
+    
+    return "_".join(parts)
 
-@dataclass
+
+@dataclass(slots=True)
 class Equipment:
     """Equipment definition with points of contact."""
     id: str
@@ -75,7 +82,7 @@ class Equipment:
     category: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Toolset:
     """Toolset containing multiple equipment pieces."""
     id: str
@@ -86,7 +93,7 @@ class Toolset:
     utility_codes: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class PathDefinition:
     """Definition of a discovered or scenario-based path."""
     id: Optional[int]
@@ -103,7 +110,7 @@ class PathDefinition:
     scenario_context: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AttemptPath:
     """Record of a random sampling attempt."""
     id: Optional[int]
@@ -118,7 +125,7 @@ class AttemptPath:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationError:
     """Node/link-level diagnostic information."""
     id: Optional[int]
@@ -140,7 +147,7 @@ class ValidationError:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewFlag:
     """Manual or critical item flagged for review."""
     id: Optional[int]
@@ -159,7 +166,7 @@ class ReviewFlag:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PathResult:
     """Result of a path discovery attempt."""
     path_found: bool
@@ -169,7 +176,7 @@ class PathResult:
     review_flags: List[ReviewFlag] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class RunResult:
     """Complete result of an analysis run."""
     run_id: str
@@ -189,9 +196,16 @@ class RunResult:
     paths_found: int = 0
     errors: List[str] = field(default_factory=list)
     review_flags: List[str] = field(default_factory=list)
+    # Enum values cached once for summary/log formatting
+    approach_str: str = field(init=False, repr=False, compare=False)
+    method_str: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.approach_str = self.approach.value
+        self.method_str = self.method.value
 
 
-@dataclass
+@dataclass(slots=True)
 class CoverageStats:
     """Coverage tracking statistics."""
     nodes_covered: int
@@ -211,7 +225,7 @@ class CoverageStats:
         return self.links_covered / self.total_links if self.total_links > 0 else 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class BiasReduction:
     """Configuration for bias reduction in random sampling."""
     max_attempts_per_toolset: int = 5
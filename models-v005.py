@@ -4,7 +4,8 @@ Enhanced data models for the path analysis system with equipment support.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, ClassVar, Mapping, Sequence, Tuple
 from enums import (
     Approach, Method, RunStatus, ObjectType, Severity, ErrorType, Building, Phase,
     ExecutionMode, ScenarioType, SourceType, FlagType, FlagStatus, CompletionStatus
@@ -136,6 +137,17 @@ class EquipmentPoC:
     priority: int = 0
     description: Optional[str] = None
     is_active: bool = True
+    
+    # Fields that decide which Equipment partitions a PoC falls into, and a
+    # counter bumped whenever any PoC sets one, so Equipment can tell its
+    # cached partitions are stale
+    _INDEXED_FIELDS: ClassVar[frozenset] = frozenset({'is_active', 'is_used', 'utility_code'})
+    _index_generation: ClassVar[int] = 0
+    
+    def __setattr__(self, name, value):
+        if name in EquipmentPoC._INDEXED_FIELDS:
+            EquipmentPoC._index_generation += 1
+        object.__setattr__(self, name, value)
 
 
 @dataclass
@@ -149,15 +161,55 @@ class Equipment:
     kind: Optional[str] = None   # PRODUCTION, PROCESSING, SUPPLY, etc.
     description: Optional[str] = None
     is_active: bool = True
-    pocs: List[EquipmentPoC] = field(default_factory=list)
+    pocs: Sequence[EquipmentPoC] = field(default_factory=tuple)
+    # PoC partitions, rebuilt lazily after pocs is reassigned or any PoC's
+    # is_active/is_used/utility_code changes
+    _active_pocs: Tuple[EquipmentPoC, ...] = field(default=(), init=False, repr=False, compare=False)
+    _used_active_pocs: Tuple[EquipmentPoC, ...] = field(default=(), init=False, repr=False, compare=False)
+    _pocs_by_utility: Mapping[str, Tuple[EquipmentPoC, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _indexed_generation: int = field(default=-1, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name, value):
+        if name == 'pocs':
+            # Kept as a tuple, so the PoC list only changes by reassignment, which resets the partitions
+            value = tuple(value)
+            object.__setattr__(self, '_indexed_generation', -1)
+        object.__setattr__(self, name, value)
     
-    def get_available_pocs(self) -> List[EquipmentPoC]:
+    def _ensure_poc_indexes(self):
+        """Rebuild the PoC partitions if they are stale."""
+        generation = EquipmentPoC._index_generation
+        if self._indexed_generation == generation:
+            return
+        active, used, by_utility = [], [], {}
+        for poc in self.pocs:
+            if not poc.is_active:
+                continue
+            active.append(poc)
+            if poc.is_used:
+                used.append(poc)
+            if poc.utility_code:
+                by_utility.setdefault(poc.utility_code, []).append(poc)
+        self._active_pocs, self._used_active_pocs = tuple(active), tuple(used)
+        self._pocs_by_utility = MappingProxyType({code: tuple(pocs) for code, pocs in by_utility.items()})
+        self._indexed_generation = generation
+    
+    def get_available_pocs(self) -> Tuple[EquipmentPoC, ...]:
         """Get active PoCs that can be used for path generation."""
-        return [poc for poc in self.pocs if poc.is_active]
+        self._ensure_poc_indexes()
+        return self._active_pocs
     
-    def get_used_pocs(self) -> List[EquipmentPoC]:
+    def get_used_pocs(self) -> Tuple[EquipmentPoC, ...]:
         """Get PoCs that are currently in use."""
-        return [poc for poc in self.pocs if poc.is_active and poc.is_used]
+        self._ensure_poc_indexes()
+        return self._used_active_pocs
+    
+    @property
+    def pocs_by_utility(self) -> Mapping[str, Tuple[EquipmentPoC, ...]]:
+        """Active PoCs grouped by utility code (read-only)."""
+        self._ensure_poc_indexes()
+        return self._pocs_by_utility
     
     @property
     def fab(self) -> str:
@@ -2,13 +2,25 @@
 Data models for the path analysis system.
 """
 
+import json
+import os
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Set
 from enums import Approach, Method, RunStatus, ObjectType, Severity, ErrorType
 
 
-@dataclass
+def new_run_id() -> str:
+    """Return a new run ID: an RFC 4122 version 4 UUID string (as str(uuid.uuid4())), built from os.urandom."""
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+@dataclass(frozen=True, slots=True)
 class RunConfig:
     """Configuration for a single analysis run."""
     run_id: str
@@ -20,7 +32,7 @@ class RunConfig:
     started_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Equipment:
     """Equipment definition with points of contact."""
     id: str
@@ -31,7 +43,7 @@ class Equipment:
     category: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Toolset:
     """Toolset containing multiple equipment pieces."""
     id: str
@@ -42,7 +54,7 @@ class Toolset:
     utility_codes: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class PathDefinition:
     """Definition of a discovered or scenario-based path."""
     id: Optional[int]
@@ -57,9 +69,29 @@ class PathDefinition:
     utilities: List[str]
     path_context: Dict[str, Any]  # Serialized nodes/links sequence
     scenario_context: Optional[Dict[str, Any]] = None
+    # Packed int64 copies of path_context['nodes'/'links'] for coverage tracking
+    node_ids_arr: array = field(default_factory=lambda: array('q'))
+    link_ids_arr: array = field(default_factory=lambda: array('q'))
+    # JSON text of path_context, encoded at most once and reused for persistence
+    path_context_json: Optional[str] = field(default=None, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.path_context and not self.node_ids_arr and not self.link_ids_arr:
+            self.node_ids_arr, self.link_ids_arr = self.arrays_from_path_context(self.path_context)
+    
+    def encoded_path_context(self) -> str:
+        """Return path_context as JSON text, serializing it only on first use."""
+        if self.path_context_json is None:
+            self.path_context_json = json.dumps(self.path_context)
+        return self.path_context_json
+    
+    @staticmethod
+    def arrays_from_path_context(path_context: Dict[str, Any]) -> tuple:
+        """Convert the nodes/links lists of a path context to packed arrays (done once per path)."""
+        return array('q', path_context.get('nodes', ())), array('q', path_context.get('links', ()))
 
 
-@dataclass
+@dataclass(slots=True)
 class AttemptPath:
     """Record of a random sampling attempt."""
     id: Optional[int]
@@ -74,7 +106,7 @@ class AttemptPath:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationError:
     """Node/link-level diagnostic information."""
     id: Optional[int]
@@ -92,11 +124,11 @@ class ValidationError:
     material: Optional[str] = None
     flow: Optional[str] = None
     item_name: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: Optional[datetime] = None  # Stamped by ValidationService when left unset
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewFlag:
     """Manual or critical item flagged for review."""
     id: Optional[int]
@@ -115,7 +147,7 @@ class ReviewFlag:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PathResult:
     """Result of a path discovery attempt."""
     path_found: bool
@@ -125,7 +157,52 @@ class PathResult:
     review_flags: List[ReviewFlag] = field(default_factory=list)
 
 
-@dataclass
+class MessageLog:
+    """
+    Append-only message list that keeps only the first `limit` entries but
+    counts every one, so long runs do not hold every error string in memory.
+    len() is the total number recorded; iteration yields the retained entries.
+    """
+    __slots__ = ('_items', '_total', 'limit')
+    
+    DEFAULT_LIMIT = 10000
+    
+    def __init__(self, messages: Iterable[str] = (), limit: int = DEFAULT_LIMIT):
+        self._items: List[str] = []
+        self._total = 0
+        self.limit = limit
+        self.extend(messages)
+    
+    def append(self, message: str):
+        """Record one message."""
+        if len(self._items) < self.limit:
+            self._items.append(message)
+        self._total += 1
+    
+    def extend(self, messages: Iterable[str]):
+        """Record several messages."""
+        for message in messages:
+            self.append(message)
+    
+    @property
+    def dropped(self) -> int:
+        """Number of recorded messages not retained."""
+        return self._total - len(self._items)
+    
+    def __len__(self) -> int:
+        return self._total
+    
+    def __iter__(self):
+        return iter(self._items)
+    
+    def __getitem__(self, index):
+        return self._items[index]
+    
+    def __repr__(self) -> str:
+        return f"MessageLog({self._items!r}, total={self._total})"
+
+
+@dataclass(slots=True)
 class RunResult:
     """Complete result of an analysis run."""
     run_id: str
@@ -143,11 +220,22 @@ class RunResult:
     duration: float  # seconds
     paths_attempted: int = 0
     paths_found: int = 0
-    errors: List[str] = field(default_factory=list)
-    review_flags: List[str] = field(default_factory=list)
+    errors: MessageLog = field(default_factory=MessageLog)
+    review_flags: MessageLog = field(default_factory=MessageLog)
+    # Enum values cached once for summary/log formatting
+    approach_str: str = field(init=False, repr=False, compare=False)
+    method_str: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.approach_str = self.approach.value
+        self.method_str = self.method.value
+        if not isinstance(self.errors, MessageLog):
+            self.errors = MessageLog(self.errors)
+        if not isinstance(self.review_flags, MessageLog):
+            self.review_flags = MessageLog(self.review_flags)
 
 
-@dataclass
+@dataclass(slots=True)
 class CoverageStats:
     """Coverage tracking statistics."""
     nodes_covered: int
@@ -155,6 +243,9 @@ class CoverageStats:
     total_nodes: int
     total_links: int
     coverage_percentage: float
+    # Covered ID sets backing the counts (shared with CoverageService, not copied per snapshot)
+    covered_nodes: Set[int] = field(default_factory=set, repr=False, compare=False)
+    covered_links: Set[int] = field(default_factory=set, repr=False, compare=False)
     
     @property
     def node_coverage(self) -> float:
@@ -167,7 +258,7 @@ class CoverageStats:
         return self.links_covered / self.total_links if self.total_links > 0 else 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class BiasReduction:
     """Configuration for bias reduction in random sampling."""
     max_attempts_per_toolset: int = 5
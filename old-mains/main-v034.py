@@ -3,20 +3,45 @@
 Main CLI application entry point for path analysis system.
 """
 
+from __future__ import annotations
+
 import argparse
+import atexit
+import functools
+import itertools
+import os
+import re
 import sys
-import uuid
+import threading
+import traceback
 from datetime import datetime
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List, Dict, NamedTuple, Tuple
 
 from enums import Approach, Method, RunStatus
 from models import RunConfig, RunResult
-from services.run_service import RunService
-from services.path_service import PathService
-from services.coverage_service import CoverageService
-from db import Database
 
+# Services and the JDBC-backed Database are imported where first used, so --help
+# and argument errors exit without loading jaydebeapi/JPype
+if TYPE_CHECKING:
+    from db import Database
+
+
+# Summary banners, built once
+_BANNER = "=" * 60
+_CONFIG_SUMMARY_HEADER = "CONFIGURATION SUMMARY"
+_RUN_SUMMARY_HEADER = "RUN SUMMARY"
+
+
+def new_run_id() -> str:
+    """Return a new run ID: a version 4 UUID string (as str(uuid.uuid4())), built from os.urandom."""
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
+
+@functools.lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
     """Create command line argument parser."""
     parser = argparse.ArgumentParser(
@@ -107,10 +132,12 @@ Examples:
 
 def get_user_choice(prompt: str, choices: List[str], default_idx: int = 0) -> str:
     """Get user choice from a list of options."""
-    print(f"\n{prompt}")
+    # Render the menu once; invalid entries only print the error line
+    menu_lines = [f"\n{prompt}"]
     for i, choice in enumerate(choices, 1):
         marker = " (default)" if i - 1 == default_idx else ""
-        print(f"  {i}. {choice}{marker}")
+        menu_lines.append(f"  {i}. {choice}{marker}")
+    print("\n".join(menu_lines))
     
     while True:
         try:
@@ -131,6 +158,46 @@ def get_user_choice(prompt: str, choices: List[str], default_idx: int = 0) -> st
             sys.exit(130)
 
 
+class FormField(NamedTuple):
+    """One yes/no question answered through get_form_input."""
+    name: str
+    label: str
+    default: bool = False
+
+
+_YES_NO = {'y': True, 'yes': True, 'n': False, 'no': False}
+
+
+def get_form_input(prompt: str, fields: List[FormField]) -> Dict[str, bool]:
+    """
+    Ask several yes/no questions with a single input line, e.g. "y,y" or "n".
+    Answers map to fields in order; missing or empty answers take the field default.
+    """
+    labels = ", ".join(f.label for f in fields)
+    defaults = ",".join("y" if f.default else "n" for f in fields)
+    
+    while True:
+        try:
+            user_input = input(f"\n{prompt} ({labels}) [default: {defaults}]: ").strip().lower()
+        except KeyboardInterrupt:
+            print("\nOperation cancelled by user.")
+            sys.exit(130)
+        
+        answers = [a.strip() for a in user_input.split(",")] if user_input else []
+        if len(answers) > len(fields) or any(a and a not in _YES_NO for a in answers):
+            print(f"Invalid input. Please answer y or n for each of: {labels} (e.g. 'y,n').")
+            continue
+        
+        return {
+            f.name: _YES_NO[answers[i]] if i < len(answers) and answers[i] else f.default
+            for i, f in enumerate(fields)
+        }
+
+
+# Decimal/scientific literals accepted by get_float_input (checked before float())
+_FLOAT_RE = re.compile(r'^[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?$')
+
+
 def get_float_input(prompt: str, default: float, min_val: float = 0.0, max_val: float = 1.0) -> float:
     """Get float input from user with validation."""
     while True:
@@ -140,13 +207,15 @@ def get_float_input(prompt: str, default: float, min_val: float = 0.0, max_val:
             if not user_input:
                 return default
             
+            if not _FLOAT_RE.match(user_input):
+                print("Invalid input. Please enter a decimal number (e.g., 0.2 for 20%).")
+                continue
+            
             value = float(user_input)
             if min_val <= value <= max_val:
                 return value
             else:
                 print(f"Value must be between {min_val} and {max_val}.")
-        except ValueError:
-            print("Invalid input. Please enter a decimal number (e.g., 0.2 for 20%).")
         except KeyboardInterrupt:
             print("\nOperation cancelled by user.")
             sys.exit(130)
@@ -154,13 +223,13 @@ def get_float_input(prompt: str, default: float, min_val: float = 0.0, max_val:
 
 def get_string_input(prompt: str, default: str = "", required: bool = False, available_options: List[str] = None) -> str:
     """Get string input from user."""
+    # Show the option list once, not again after every empty required entry
+    if available_options:
+        print("\n".join([f"\n{prompt}", "Available options:"] + [f"  - {option}" for option in available_options]))
+    
     while True:
         try:
             if available_options:
-                print(f"\n{prompt}")
-                print("Available options:")
-                for option in available_options:
-                    print(f"  - {option}")
                 user_input = input(f"Enter value [default: {default}]: " if default else "Enter value: ").strip()
             else:
                 user_input = input(f"{prompt} [default: {default}]: " if default else f"{prompt}: ").strip()
@@ -180,29 +249,130 @@ def get_string_input(prompt: str, default: str = "", required: bool = False, ava
             sys.exit(130)
 
 
+# Process-wide database handle shared by the option lookups and runs
+_DB_SINGLETON: Optional[Database] = None
+_DB_LOCK = threading.Lock()
+
+
+def get_db() -> Database:
+    """Return the shared Database, connecting on first use."""
+    global _DB_SINGLETON
+    if _DB_SINGLETON is None:
+        with _DB_LOCK:
+            if _DB_SINGLETON is None:
+                from db import Database
+                _DB_SINGLETON = Database()
+    return _DB_SINGLETON
+
+
+def _close_db():
+    """Close the shared Database at interpreter exit."""
+    global _DB_SINGLETON
+    if _DB_SINGLETON is not None:
+        _DB_SINGLETON.close()
+        _DB_SINGLETON = None
+
+
+atexit.register(_close_db)
+
+
+# Option lookup queries, run through statements prepared once per connection.
+# Fab lists come from the fabs dimension table when it exists (no scan of run
+# history), else from tb_runs; {fab_source} is filled in by _fab_sql().
+FABS_SQL = "SELECT DISTINCT fab FROM {fab_source} ORDER BY fab"
+# Zero-row probe; portable, unlike LIMIT / FETCH FIRST
+FABS_DIM_PROBE_SQL = "SELECT fab FROM fabs WHERE 1 = 0"
+SCENARIOS_SQL = "SELECT DISTINCT name FROM scenarios ORDER BY name"
+TOOLSETS_SQL = "SELECT DISTINCT toolset_id FROM toolsets WHERE fab = ? ORDER BY toolset_id"
+DEFAULT_FAB_SQL = "SELECT MIN(fab) FROM {fab_source}"
+# Fabs ('F' rows) and per-fab toolsets ('T' rows) in one round trip
+FABS_AND_TOOLSETS_SQL = """
+    SELECT DISTINCT 'F' AS k, fab AS v1, NULL AS v2 FROM {fab_source}
+    UNION ALL
+    SELECT DISTINCT 'T', fab, toolset_id FROM toolsets
+    ORDER BY 1, 2, 3
+    """
+
+
+# Memo tables for the option lookups below, keyed by the lookup arguments after db
+_OPTION_CACHES: List[dict] = []
+
+
+def _cache_options(func):
+    """
+    Memoize an option lookup for the session, keyed on its arguments after
+    db. A None result (nothing found, or the query failed) is not memoized,
+    so the next call queries again.
+    """
+    cache = {}
+    _OPTION_CACHES.append(cache)
+    
+    @functools.wraps(func)
+    def wrapper(db: Database, *key):
+        if key in cache:
+            return cache[key]
+        result = func(db, *key)
+        if result is not None:
+            cache[key] = result
+        return result
+    
+    def prime(value, *key):
+        cache[key] = value
+    
+    wrapper.cache_clear = cache.clear
+    wrapper.prime = prime
+    return wrapper
+
+
+def clear_option_caches():
+    """Drop memoized fab/scenario/toolset lookups so the next call re-queries."""
+    for cache in _OPTION_CACHES:
+        cache.clear()
+
+
+# Table the fab lists are read from; probed once on first fab lookup
+_fab_source: Optional[str] = None
+
+
+def _fab_sql(db: Database, sql: str) -> str:
+    """Fill {fab_source} in sql: the fabs dimension table if present, else tb_runs."""
+    global _fab_source
+    if _fab_source is None:
+        import jaydebeapi
+        try:
+            db.query(FABS_DIM_PROBE_SQL)
+            _fab_source = "fabs"
+        except jaydebeapi.DatabaseError:
+            _fab_source = "tb_runs"
+    return sql.format(fab_source=_fab_source)
+
+
+@_cache_options
 def get_available_fabs(db: Database) -> List[str]:
     """Get available fabs from database."""
     try:
-        sql = "SELECT DISTINCT fab FROM tb_runs ORDER BY fab"
-        results = db.query(sql)
-        fabs = [row[0] for row in results] if results else []
-        
-        # Add some common default fabs if none found
-        if not fabs:
-            fabs = ["M16", "M15", "M14", "M13"]
-        
-        return fabs
+        return _fab_options(db.query_column_prepared(_fab_sql(db, FABS_SQL)))
     except Exception as e:
         print(f"Warning: Could not retrieve fabs from database: {e}")
         return ["M16", "M15", "M14", "M13"]  # Default options
 
 
+@_cache_options
+def get_default_fab(db: Database) -> Optional[str]:
+    """Get the first fab from the database (single-row read), or None if there is none."""
+    try:
+        fabs = db.query_column_prepared(_fab_sql(db, DEFAULT_FAB_SQL))
+    except Exception as e:
+        print(f"Warning: Could not retrieve default fab from database: {e}")
+        return None
+    return fabs[0] if fabs else None  # MIN() over no rows yields a single NULL
+
+
+@_cache_options
 def get_available_scenarios(db: Database) -> List[str]:
     """Get available scenarios from database."""
     try:
-        sql = "SELECT DISTINCT name FROM scenarios ORDER BY name"
-        results = db.query(sql)
-        scenarios = [row[0] for row in results] if results else []
+        scenarios = db.query_column_prepared(SCENARIOS_SQL)
         
         # Add some default options if none found
         if not scenarios:
@@ -212,41 +382,77 @@ def get_available_scenarios(db: Database) -> List[str]:
     except Exception as e:
         print(f"Warning: Could not retrieve scenarios from database: {e}")
         return ["test-scenario-01", "test-scenario-02", "validation-suite"]
+
+
+@_cache_options
+def get_available_toolsets(db: Database, fab: str) -> List[str]:
     """Get available toolsets for a specific fab."""
     try:
-        sql = "SELECT DISTINCT toolset_id FROM toolsets WHERE fab = ? ORDER BY toolset_id"
-        results = db.query(sql, [fab])
-        toolsets = [row[0] for row in results] if results else []
-        
-        # Add "ALL" option and empty option
-        options = ["ALL", ""]
-        if toolsets:
-            options.extend(toolsets)
-        else:
-            # Default toolsets if none found
-            options.extend(["TOOLSET_001", "TOOLSET_002", "TOOLSET_003"])
-        
-        return options
+        return _toolset_options(db.query_column_prepared(TOOLSETS_SQL, [fab]))
     except Exception as e:
         print(f"Warning: Could not retrieve toolsets from database: {e}")
         return ["ALL", "", "TOOLSET_001", "TOOLSET_002", "TOOLSET_003"]
 
 
-def get_available_toolsets(db: Database, fab: str) -> List[str]:
+def get_fabs_and_toolsets(db: Database) -> Tuple[List[str], Dict[str, List[str]]]:
+    """
+    Fetch the fabs and each fab's toolsets in a single query and seed the
+    get_available_fabs/get_available_toolsets caches, so later lookups are
+    dict hits.
+    """
+    fabs = []
+    toolsets_by_fab = {}
+    try:
+        rows = db.query(_fab_sql(db, FABS_AND_TOOLSETS_SQL))
+    except Exception as e:
+        print(f"Warning: Could not retrieve fabs and toolsets from database: {e}")
+        return fabs, toolsets_by_fab
+    
+    for kind, fab, toolset_id in rows:
+        if kind == 'F':
+            fabs.append(fab)
+        else:
+            toolsets_by_fab.setdefault(fab, []).append(toolset_id)
+    
+    get_available_fabs.prime(_fab_options(fabs))
+    for fab in toolsets_by_fab.keys() | set(fabs):
+        get_available_toolsets.prime(_toolset_options(toolsets_by_fab.get(fab, [])), fab)
+    
+    return fabs, toolsets_by_fab
+
+
+def _fab_options(fabs: List[str]) -> List[str]:
+    """Fab menu options, falling back to common fabs if none found."""
+    return fabs or ["M16", "M15", "M14", "M13"]
+
+
+def _toolset_options(toolsets: List[str]) -> List[str]:
+    """Toolset menu options: "ALL", empty, then the toolsets (or defaults if none found)."""
+    return ["ALL", ""] + (toolsets or ["TOOLSET_001", "TOOLSET_002", "TOOLSET_003"])
+
+
+# Allowed method names per approach
+_RANDOM_METHODS = frozenset({'SIMPLE', 'STRATIFIED'})
+_SCENARIO_METHODS = frozenset({'PREDEFINED', 'SYNTHETIC'})
+
+
+def validate_method(approach: Approach, method: Optional[str]) -> Method:
     """Validate and return the appropriate method for the given approach."""
     if approach == Approach.RANDOM:
         if method is None:
             return Method.SIMPLE
-        if method.upper() not in ['SIMPLE', 'STRATIFIED']:
+        method_upper = sys.intern(method.upper())
+        if method_upper not in _RANDOM_METHODS:
             raise ValueError(f"Invalid method '{method}' for RANDOM approach. Use SIMPLE or STRATIFIED.")
-        return Method(method.upper())
+        return Method(method_upper)
     
     elif approach == Approach.SCENARIO:
         if method is None:
             return Method.PREDEFINED
-        if method.upper() not in ['PREDEFINED', 'SYNTHETIC']:
+        method_upper = sys.intern(method.upper())
+        if method_upper not in _SCENARIO_METHODS:
             raise ValueError(f"Invalid method '{method}' for SCENARIO approach. Use PREDEFINED or SYNTHETIC.")
-        return Method(method.upper())
+        return Method(method_upper)
     
     else:
         raise ValueError(f"Unknown approach: {approach}")
@@ -265,231 +471,123 @@ def validate_approach_specific_args(approach: Approach, args) -> None:
             print(f"Warning: --toolset is ignored for SCENARIO approach")
 
 
-def validate_method_for_approach(approach: Approach, method: Optional[str]) -> Method:
-    """Validate and return the appropriate method for the given approach."""
-    if approach == Approach.RANDOM:
-        if method.upper() not in ['SIMPLE', 'STRATIFIED']:
-            raise ValueError(f"Invalid method '{method}' for RANDOM approach. Use SIMPLE or STRATIFIED.")
-        return Method(method.upper())
-    
-    elif approach == Approach.SCENARIO:
-        if method.upper() not in ['PREDEFINED', 'SYNTHETIC']:
-            raise ValueError(f"Invalid method '{method}' for SCENARIO approach. Use PREDEFINED or SYNTHETIC.")
-        return Method(method.upper())
-    
-    else:
-        raise ValueError(f"Unknown approach: {approach}")
-
-
-def validate_method(approach: Approach, method: str) -> Method:
-    """Print configuration summary."""
-    print(f"\n{'='*60}")
-    print(f"CONFIGURATION SUMMARY")
-    print(f"{'='*60}")
-    print(f"Run ID: {config.run_id}")
-    print(f"Approach: {config.approach.value}")
-    print(f"Method: {config.method.value}")
-    print(f"Coverage Target: {config.coverage_target:.1%}")
-    print(f"Fab: {config.fab}")
-    if config.toolset:
-        print(f"Toolset: {config.toolset}")
-    print(f"Tag: {config.tag}")
-    print(f"Started: {config.started_at.strftime('%Y-%m-%d %H:%M:%S')}")
-
-
 def print_configuration_summary(config: RunConfig, scenario_file: str = "", scenario_name: str = ""):
     """Print configuration summary."""
-    print(f"\n{'='*60}")
-    print(f"CONFIGURATION SUMMARY")
-    print(f"{'='*60}")
-    print(f"Run ID: {config.run_id}")
-    print(f"Approach: {config.approach.value}")
-    print(f"Method: {config.method.value}")
-    print(f"Coverage Target: {config.coverage_target:.1%}")
+    lines = [
+        "",
+        _BANNER,
+        _CONFIG_SUMMARY_HEADER,
+        _BANNER,
+        f"Run ID: {config.run_id}",
+        f"Approach: {config.approach.value}",
+        f"Method: {config.method.value}",
+        f"Coverage Target: {config.coverage_target:.1%}",
+    ]
     
     if config.approach == Approach.RANDOM:
-        print(f"Fab: {config.fab}")
+        lines.append(f"Fab: {config.fab}")
         if config.toolset:
-            print(f"Toolset: {config.toolset}")
+            lines.append(f"Toolset: {config.toolset}")
     elif config.approach == Approach.SCENARIO:
         if scenario_file:
-            print(f"Scenario File: {scenario_file}")
+            lines.append(f"Scenario File: {scenario_file}")
         if scenario_name:
-            print(f"Scenario Name: {scenario_name}")
+            lines.append(f"Scenario Name: {scenario_name}")
     
-    print(f"Tag: {config.tag}")
-    print(f"Started: {config.started_at.strftime('%Y-%m-%d %H:%M:%S')}")
+    lines.append(f"Tag: {config.tag}")
+    lines.append(f"Started: {config.started_at.strftime('%Y-%m-%d %H:%M:%S')}")
+    
+    # One write for the whole block instead of one print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def print_run_summary(result: RunResult, verbose: bool = False):
     """Print run summary to console."""
-    print(f"\n{'='*60}")
-    print(f"RUN SUMMARY")
-    print(f"{'='*60}")
-    print(f"Run ID: {result.run_id}")
-    print(f"Approach: {result.approach.value}")
-    print(f"Method: {result.method.value}")
-    print(f"Fab: {result.fab}")
-    print(f"Tag: {result.tag}")
-    print(f"Status: {result.status.value}")
-    print(f"Duration: {result.duration:.2f}s")
-    print(f"\nCOVERAGE RESULTS:")
-    print(f"Target Coverage: {result.coverage_target:.1%}")
-    print(f"Achieved Coverage: {result.total_coverage:.1%}")
-    print(f"Total Nodes: {result.total_nodes:,}")
-    print(f"Total Links: {result.total_links:,}")
+    lines = [
+        "",
+        _BANNER,
+        _RUN_SUMMARY_HEADER,
+        _BANNER,
+        f"Run ID: {result.run_id}",
+        f"Approach: {result.approach.value}",
+        f"Method: {result.method.value}",
+        f"Fab: {result.fab}",
+        f"Tag: {result.tag}",
+        f"Status: {result.status.value}",
+        f"Duration: {result.duration:.2f}s",
+        "",
+        "COVERAGE RESULTS:",
+        f"Target Coverage: {result.coverage_target:.1%}",
+        f"Achieved Coverage: {result.total_coverage:.1%}",
+        f"Total Nodes: {result.total_nodes:,}",
+        f"Total Links: {result.total_links:,}",
+    ]
     
     if verbose and result.errors:
-        print(f"\nERRORS ({len(result.errors)}):")
-        for error in result.errors[:10]:  # Show first 10 errors
-            print(f"  - {error}")
+        lines.append(f"\nERRORS ({len(result.errors)}):")
+        lines.extend(f"  - {error}" for error in result.errors[:10])  # Show first 10 errors
         if len(result.errors) > 10:
-            print(f"  ... and {len(result.errors) - 10} more errors")
+            lines.append(f"  ... and {len(result.errors) - 10} more errors")
     
     if verbose and result.review_flags:
-        print(f"\nREVIEW FLAGS ({len(result.review_flags)}):")
-        for flag in result.review_flags[:5]:  # Show first 5 flags
-            print(f"  - {flag}")
+        lines.append(f"\nREVIEW FLAGS ({len(result.review_flags)}):")
+        lines.extend(f"  - {flag}" for flag in result.review_flags[:5])  # Show first 5 flags
         if len(result.review_flags) > 5:
-            print(f"  ... and {len(result.review_flags) - 5} more flags")
+            lines.append(f"  ... and {len(result.review_flags) - 5} more flags")
+    
+    # One write for the whole block instead of one print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def print_run_summary(result: RunResult, verbose: bool = False):
-    """Execute a run with the given configuration."""
-    # Initialize database and services
-    db = Database()
-    try:
-        run_service = RunService(db)
-        path_service = PathService(db)
-        coverage_service = CoverageService(db)
-        
-        # The toolset is now part of the config object
-        result = run_service.execute_run(config, path_service, coverage_service, verbose=verbose)
-        return result
-        
-    finally:
-        db.close()
+def execute_run_with_config(config: RunConfig, scenario_file: str = "", scenario_name: str = "", verbose: bool = False,
+                            db: Optional[Database] = None,
+                            cancel_event: Optional[threading.Event] = None) -> RunResult:
+    """Execute a run with the given configuration (setting cancel_event stops it early)."""
+    from services.run_service import RunService
+    from services.path_service import PathService
+    from services.coverage_service import CoverageService
+    
+    # Initialize services on the shared database handle (left open for later runs)
+    if db is None:
+        db = get_db()
+    run_service = RunService(db)
+    path_service = PathService(db)
+    coverage_service = CoverageService(db)
+    
+    # Pass scenario parameters if this is a SCENARIO approach
+    if config.approach == Approach.SCENARIO:
+        # TODO: Pass scenario_file and scenario_name to the run service
+        # For now, these will be stored in the config or passed separately
+        pass
+    
+    result = run_service.execute_run(config, path_service, coverage_service, verbose=verbose,
+                                     cancel_event=cancel_event)
+    
+    # The run wrote to tb_runs, so memoized fab (and dependent toolset) lists may be stale
+    clear_option_caches()
+    return result
 
 
-def execute_run_with_config(config: RunConfig, scenario_file: str = "", scenario_name: str = "", verbose: bool = False) -> RunResult:
-    """Execute a run with the given configuration."""
-    # Initialize database and services
-    db = Database()
-    try:
-        run_service = RunService(db)
-        path_service = PathService(db)
-        coverage_service = CoverageService(db)
-        
-        # Pass scenario parameters if this is a SCENARIO approach
-        if config.approach == Approach.SCENARIO:
-            # TODO: Pass scenario_file and scenario_name to the run service
-            # For now, these will be stored in the config or passed separately
-            pass
-        
-        result = run_service.execute_run(config, path_service, coverage_service, verbose=verbose)
-        return result
-        
-    finally:
-        db.close()
-    """Run the application in unattended mode using command line arguments."""
+_SPINNER_FRAMES = "|/-\\"
+
+
+def _wait_for_run(future, show_spinner: bool) -> RunResult:
+    """Block until the run future completes, drawing a spinner while it works."""
+    from concurrent.futures import TimeoutError as FutureTimeoutError
+    
+    frames = itertools.cycle(_SPINNER_FRAMES)
     try:
-        # Validate required arguments
-        if not args.approach:
-            raise ValueError("--approach is required for unattended mode")
-        if not args.coverage_target:
-            raise ValueError("--coverage-target is required for unattended mode")
-        
-        # Validate inputs
-        approach = Approach(args.approach)
-        method = validate_method_for_approach(approach, args.method)
-        
-        if not (0.0 < args.coverage_target <= 1.0):
-            raise ValueError("Coverage target must be between 0.0 and 1.0")
-        
-        # Handle optional fab (use default if not provided)
-        fab = args.fab or ""
-        toolset = args.toolset or ""
-        
-        # If fab is not provided, try to get a default from database
-        if not fab:
-            db = Database()
+        while True:
             try:
-                available_fabs = get_available_fabs(db)
-                if available_fabs:
-                    fab = available_fabs[0]  # Use first available fab as default
-                    if args.verbose and not args.unattended:
-                        print(f"No fab specified, using default: {fab}")
-                else:
-                    fab = "DEFAULT"  # Fallback if no fabs in database
-                    if args.verbose and not args.unattended:
-                        print(f"No fabs found in database, using: {fab}")
-            except Exception as e:
-                fab = "DEFAULT"
-                if args.verbose and not args.unattended:
-                    print(f"Could not retrieve fabs from database, using: {fab}")
-            finally:
-                db.close()
-        
-        # Generate tag and create run configuration
-        config = RunConfig.create_with_auto_tag(
-            run_id=str(uuid.uuid4()),
-            approach=approach,
-            method=method,
-            coverage_target=args.coverage_target,
-            fab=fab,
-            toolset=toolset,
-            started_at=datetime.now()
-        )
-        
-        # Output based on mode
-        if args.unattended:
-            # Silent mode - minimal output
-            pass  # No startup message
-        elif args.verbose:
-            # Verbose mode - full configuration
-            print_configuration_summary(config)
-            print(f"\nStarting analysis run...")
-        else:
-            # Standard mode - brief message
-            fab_display = f" for {fab}" if fab and fab != "DEFAULT" else ""
-            print(f"Starting {approach.value} {method.value} analysis{fab_display} (target: {args.coverage_target:.1%})")
-        
-        # Execute the run (verbose is ignored if unattended)
-        verbose_mode = args.verbose and not args.unattended
-        result = execute_run_with_config(config, verbose_mode)
-        
-        # Output based on mode
-        if args.unattended:
-            # Silent mode - just print "completed" and run ID
-            if result.status == RunStatus.DONE:
-                print("completed")
-                sys.exit(0)
-            else:
-                print("failed")
-                sys.exit(1)
-        else:
-            # Standard/verbose mode - print full summary
-            print_run_summary(result, verbose=verbose_mode)
-            
-            # Exit with appropriate code
-            if result.status == RunStatus.DONE:
-                if not args.verbose:
-                    print(f"✅ Analysis completed successfully! Run ID: {result.run_id}")
-                sys.exit(0)
-            else:
-                if not args.verbose:
-                    print(f"❌ Analysis failed. Run ID: {result.run_id}")
-                sys.exit(1)
-            
-    except Exception as e:
-        if args.unattended:
-            # Silent mode - just print "error"
-            print("error")
-            sys.exit(1)
-        else:
-            # Standard mode - print error details
-            print(f"Error: {e}", file=sys.stderr)
-            if args.verbose:
-                import traceback
-                traceback.print_exc()
-            sys.exit(1)
+                return future.result(timeout=0.25)
+            except FutureTimeoutError:
+                if show_spinner:
+                    sys.stdout.write(f"\rRunning... {next(frames)}")
+                    sys.stdout.flush()
+    finally:
+        if show_spinner:
+            sys.stdout.write("\r" + " " * 20 + "\r")
+            sys.stdout.flush()
 
 
 def unattended_mode(args) -> None:
@@ -503,7 +601,7 @@ def unattended_mode(args) -> None:
         
         # Validate inputs
         approach = Approach(args.approach)
-        method = validate_method_for_approach(approach, args.method)
+        method = validate_method(approach, args.method)
         
         if not (0.0 < args.coverage_target <= 1.0):
             raise ValueError("Coverage target must be between 0.0 and 1.0")
@@ -524,11 +622,11 @@ def unattended_mode(args) -> None:
             
             # If fab is not provided, try to get a default from database
             if not fab:
-                db = Database()
+                db = get_db()
                 try:
-                    available_fabs = get_available_fabs(db)
-                    if available_fabs:
-                        fab = available_fabs[0]  # Use first available fab as default
+                    default_fab = get_default_fab(db)
+                    if default_fab:
+                        fab = default_fab  # Use first fab in the database as default
                         if args.verbose and not args.unattended:
                             print(f"No fab specified, using default: {fab}")
                     else:
@@ -539,8 +637,6 @@ def unattended_mode(args) -> None:
                     fab = "DEFAULT"
                     if args.verbose and not args.unattended:
                         print(f"Could not retrieve fabs from database, using: {fab}")
-                finally:
-                    db.close()
         
         elif approach == Approach.SCENARIO:
             # Handle SCENARIO approach configuration
@@ -554,14 +650,13 @@ def unattended_mode(args) -> None:
                     print("No scenario file or name specified, will use default scenario selection")
         
         # Generate tag and create run configuration
+        # Run start time, taken once and shared by the tag date and started_at
+        started_at = datetime.now()
+        
+        # Positional: (run_id, approach, method, coverage_target, fab, toolset, started_at),
+        # keep in step with RunConfig.create_with_auto_tag's signature
         config = RunConfig.create_with_auto_tag(
-            run_id=str(uuid.uuid4()),
-            approach=approach,
-            method=method,
-            coverage_target=args.coverage_target,
-            fab=fab,
-            toolset=toolset,
-            started_at=datetime.now()
+            new_run_id(), approach, method, args.coverage_target, fab, toolset, started_at
         )
         
         # Output based on mode
@@ -617,139 +712,25 @@ def unattended_mode(args) -> None:
             # Standard mode - print error details
             print(f"Error: {e}", file=sys.stderr)
             if args.verbose:
-                import traceback
                 traceback.print_exc()
             sys.exit(1)
-    """Run the application in interactive mode."""
-    print("=" * 60)
-    print("PATH ANALYSIS CLI TOOL")
-    print("=" * 60)
-    print("Welcome! This tool will guide you through setting up a path analysis run.")
-    
-    # Initialize database connection for options lookup
-    db = Database()
-    
-    try:
-        # 1. Select approach
-        approach_str = get_user_choice(
-            "Select analysis approach:",
-            ["RANDOM", "SCENARIO"],
-            default_idx=0
-        )
-        approach = Approach(approach_str)
-        
-        # 2. Select method based on approach
-        if approach == Approach.RANDOM:
-            method_choices = ["SIMPLE", "STRATIFIED"]
-            method_help = "SIMPLE: Basic random sampling\nSTRATIFIED: Stratified random sampling (advanced)"
-        else:
-            method_choices = ["PREDEFINED", "SYNTHETIC"]
-            method_help = "PREDEFINED: Use existing scenarios\nSYNTHETIC: Generate synthetic scenarios"
-        
-        print(f"\n{method_help}")
-        method_str = get_user_choice(
-            f"Select method for {approach_str} approach:",
-            method_choices,
-            default_idx=0
-        )
-        method = validate_method(approach, method_str)
-        
-        # 3. Get coverage target
-        coverage_target = get_float_input(
-            "\nEnter coverage target (as decimal, e.g., 0.2 for 20%)",
-            default=0.2,
-            min_val=0.01,
-            max_val=1.0
-        )
-        
-        # 4. Select fab
-        available_fabs = get_available_fabs(db)
-        fab = get_string_input(
-            "\nEnter fabrication identifier (fab)",
-            required=True,
-            available_options=available_fabs
-        )
-        
-        # 5. Select toolset (optional)
-        available_toolsets = get_available_toolsets(db, fab)
-        print("\nToolset selection (optional):")
-        print("  - Leave empty to use all toolsets")
-        print("  - Enter 'ALL' to explicitly use all toolsets")
-        print("  - Enter specific toolset ID to limit analysis")
-        
-        toolset = get_string_input(
-            "Enter toolset ID",
-            default="",
-            required=False,
-            available_options=available_toolsets
-        )
-        
-        # 6. Generate tag and create configuration
-        config = RunConfig.create_with_auto_tag(
-            run_id=str(uuid.uuid4()),
-            approach=approach,
-            method=method,
-            coverage_target=coverage_target,
-            fab=fab,
-            toolset=toolset,
-            started_at=datetime.now()
-        )
-        verbose_choice = get_user_choice(
-            "Enable verbose output?",
-            ["No", "Yes"],
-            default_idx=0
-        )
-        verbose = verbose_choice == "Yes"
-        
-        # 7. Verbose option
-        
-        # Show configuration and confirm
-        print_configuration_summary(config)
-        
-        confirm = get_user_choice(
-            "\nProceed with this configuration?",
-            ["Yes", "No"],
-            default_idx=0
-        )
-        
-        if confirm == "No":
-            print("Operation cancelled.")
-            return
-        
-        # Execute the run
-        print(f"\nStarting analysis run...")
-        print(f"This may take several minutes depending on coverage target and network size.")
-        
-        result = execute_run_with_config(config, verbose)
-        
-        # Print results
-        print_run_summary(result, verbose=verbose)
-        
-        # Exit with appropriate code
-        if result.status == RunStatus.DONE:
-            print(f"\n✅ Analysis completed successfully!")
-            print(f"📊 Results stored with run ID: {result.run_id}")
-            sys.exit(0)
-        else:
-            print(f"\n❌ Analysis failed. Check logs for details.")
-            sys.exit(1)
-            
-    except Exception as e:
-        print(f"\nError: {e}", file=sys.stderr)
-        sys.exit(1)
-    finally:
-        db.close()
 
 
 def interactive_mode():
     """Run the application in interactive mode."""
-    print("=" * 60)
+    print(_BANNER)
     print("PATH ANALYSIS CLI TOOL")
-    print("=" * 60)
+    print(_BANNER)
     print("Welcome! This tool will guide you through setting up a path analysis run.")
     
-    # Initialize database connection for options lookup
-    db = Database()
+    # Shared database connection for options lookup and the run itself
+    db = get_db()
+    
+    # Fetch the option lists in the background while the user answers the first prompts
+    from concurrent.futures import ThreadPoolExecutor
+    executor = ThreadPoolExecutor(max_workers=2)
+    scenarios_future = executor.submit(get_available_scenarios, db)
+    fab_options_future = executor.submit(get_fabs_and_toolsets, db)
     
     try:
         # 1. Select approach
@@ -791,7 +772,8 @@ def interactive_mode():
         scenario_name = ""
         
         if approach == Approach.RANDOM:
-            # RANDOM approach: get fab and toolset
+            # RANDOM approach: get fab and toolset (prefetched together in one round trip)
+            fab_options_future.result()
             available_fabs = get_available_fabs(db)
             fab = get_string_input(
                 "\nEnter fabrication identifier (fab)",
@@ -825,7 +807,7 @@ def interactive_mode():
             )
             
             if not scenario_file:
-                available_scenarios = get_available_scenarios(db)
+                available_scenarios = scenarios_future.result()
                 scenario_name = get_string_input(
                     "Enter scenario name (optional)",
                     default="",
@@ -834,34 +816,25 @@ def interactive_mode():
                 )
         
         # 5. Generate tag and create configuration
-        config = RunConfig.create_with_auto_tag(
-            run_id=str(uuid.uuid4()),
-            approach=approach,
-            method=method,
-            coverage_target=coverage_target,
-            fab=fab,
-            toolset=toolset,
-            started_at=datetime.now()
-        )
+        # Run start time, taken once and shared by the tag date and started_at
+        started_at = datetime.now()
         
-        # 6. Verbose option
-        verbose_choice = get_user_choice(
-            "\nEnable verbose output?",
-            ["No", "Yes"],
-            default_idx=0
+        # Positional: (run_id, approach, method, coverage_target, fab, toolset, started_at),
+        # keep in step with RunConfig.create_with_auto_tag's signature
+        config = RunConfig.create_with_auto_tag(
+            new_run_id(), approach, method, coverage_target, fab, toolset, started_at
         )
-        verbose = verbose_choice == "Yes"
         
-        # Show configuration and confirm
+        # 6. Show configuration, then confirm and pick verbose output in one prompt
         print_configuration_summary(config, scenario_file, scenario_name)
         
-        confirm = get_user_choice(
-            "\nProceed with this configuration?",
-            ["Yes", "No"],
-            default_idx=0
+        answers = get_form_input(
+            "Proceed with this configuration?",
+            [FormField("proceed", "proceed", True), FormField("verbose", "verbose output", False)]
         )
+        verbose = answers["verbose"]
         
-        if confirm == "No":
+        if not answers["proceed"]:
             print("Operation cancelled.")
             return
         
@@ -869,29 +842,64 @@ def interactive_mode():
         print(f"\nStarting analysis run...")
         print(f"This may take several minutes depending on coverage target and network size.")
         
-        result = execute_run_with_config(config, scenario_file, scenario_name, verbose)
+        # Run on a worker thread so Ctrl-C can stop it cleanly and keep the partial result
+        cancel_event = threading.Event()
+        run_future = executor.submit(execute_run_with_config, config, scenario_file, scenario_name,
+                                     verbose, db, cancel_event)
+        show_spinner = not verbose and sys.stdout.isatty()
+        try:
+            result = _wait_for_run(run_future, show_spinner)
+        except KeyboardInterrupt:
+            cancel_event.set()
+            if config.approach == Approach.RANDOM:
+                print("\nCancelling run after the current attempt (press Ctrl-C again to abort)...")
+            else:
+                # Only random sampling checks cancel_event; a scenario run finishes normally
+                print("\nScenario runs cannot be cancelled; waiting for it to finish (press Ctrl-C again to abort)...")
+            try:
+                result = _wait_for_run(run_future, False)
+            except KeyboardInterrupt:
+                # The run's worker thread is not a daemon, so a normal exit would
+                # wait for it to finish; leave the process immediately instead
+                print("\nRun aborted.")
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(130)
         
         # Print results
         print_run_summary(result, verbose=verbose)
         
         # Exit with appropriate code
         if result.status == RunStatus.DONE:
-            print(f"\n✅ Analysis completed successfully!")
-            print(f"📊 Results stored with run ID: {result.run_id}")
-            sys.exit(0)
+            sys.stdout.write(f"\n✅ Analysis completed successfully!\n📊 Results stored with run ID: {result.run_id}\n")
+            exit_code = 0
         else:
-            print(f"\n❌ Analysis failed. Check logs for details.")
-            sys.exit(1)
+            sys.stdout.write("\n❌ Analysis failed. Check logs for details.\n")
+            exit_code = 1
+        
+        # Closing the database is the only teardown that matters here; os._exit skips
+        # the atexit hooks and finalizers, including the slow JVM shutdown
+        executor.shutdown(wait=False)
+        _close_db()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
             
     except Exception as e:
         print(f"\nError: {e}", file=sys.stderr)
         sys.exit(1)
     finally:
-        db.close()
+        executor.shutdown(wait=False)
+
+
+def main():
     """Main CLI entry point."""
-    parser = create_parser()
+    # Flush every line even when stdout is piped (e.g. through tee), so prompts and
+    # progress messages show up as they are printed rather than when the buffer fills
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=True)
     
-    # If no arguments provided, run in interactive mode
+    # If no arguments provided, run in interactive mode (no parser needed)
     if len(sys.argv) == 1:
         try:
             interactive_mode()
@@ -900,7 +908,7 @@ def interactive_mode():
             sys.exit(130)
     else:
         # Parse arguments and run in unattended mode
-        args = parser.parse_args()
+        args = create_parser().parse_args()
         try:
             unattended_mode(args)
         except KeyboardInterrupt:
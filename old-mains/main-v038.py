@@ -3,26 +3,54 @@
 Main CLI application entry point for path analysis system.
 """
 
+from __future__ import annotations
+
 import argparse
+import functools
+import itertools
+import json
+import os
 import sys
-import uuid
+import threading
+import time
+import traceback
+from collections import namedtuple
 from datetime import datetime
-from typing import Optional, List
+from typing import TYPE_CHECKING, Callable, Optional, List, Dict, Tuple
 
 from enums import Approach, Method, RunStatus
 from models import RunConfig, RunResult
-from services.run_service import RunService
-from services.path_service import PathService
-from services.coverage_service import CoverageService
-from db import Database
 
+if TYPE_CHECKING:
+    from db import Database
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create command line argument parser."""
-    parser = argparse.ArgumentParser(
-        description="Path Analysis CLI Tool",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+
+# Service layer classes, imported on first use so --help and argument errors
+# never load the JDBC stack
+_Services = namedtuple('_Services', 'RunService PathService CoverageService Database')
+
+
+def _services() -> _Services:
+    """Import and return the service and database classes."""
+    from services.run_service import RunService
+    from services.path_service import PathService
+    from services.coverage_service import CoverageService
+    from db import Database
+    return _Services(RunService, PathService, CoverageService, Database)
+
+
+def _approach_arg(value: str) -> Approach:
+    """argparse type for --approach: parse the name straight to an Approach member."""
+    try:
+        return _APPROACH_MAP[value.upper()]
+    except KeyError:
+        raise argparse.ArgumentTypeError(
+            f"invalid choice: '{value}' (choose from {', '.join(_APPROACH_MAP)})"
+        ) from None
+
+
+# Usage examples shown after the --help option list
+_EPILOG = """
 Examples:
   Default (quick random test with default settings):
     python main.py
@@ -47,19 +75,37 @@ Examples:
     python main.py --fab M16 --unattended
     python main.py -a SCENARIO --by-code "PREXXXXXXX" --unattended
         """
+
+
+def new_run_id() -> str:
+    """Return a new run ID: a version 4 UUID string (as str(uuid.uuid4())), built from os.urandom."""
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+@functools.lru_cache(maxsize=1)
+def create_parser() -> argparse.ArgumentParser:
+    """Create command line argument parser."""
+    parser = argparse.ArgumentParser(
+        description="Path Analysis CLI Tool",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
     
     parser.add_argument(
         '--approach', '-a',
-        type=str,
-        choices=['RANDOM', 'SCENARIO'],
-        default='RANDOM',
+        type=_approach_arg,
+        metavar='{RANDOM,SCENARIO}',
+        default=Approach.RANDOM,
         help='Analysis approach (default: RANDOM)'
     )
     
     parser.add_argument(
         '--method',
-        type=str,
+        type=str.upper,
         help='Analysis method - only for RANDOM approach (SIMPLE/STRATIFIED) - defaults to SIMPLE'
     )
     
@@ -96,18 +142,21 @@ Examples:
     )
     
     parser.add_argument(
-        '--interactive', '-i',
+        '--verbose', '-v',
         action='store_true',
-        help='Run in interactive mode for exploration and training'
+        help='Enable verbose output (ignored if --unattended is used)'
     )
     
-    parser.add_argument(
-        '--verbose', '-v',
+    # Run modes; argparse rejects giving both
+    mode_group = parser.add_mutually_exclusive_group()
+    
+    mode_group.add_argument(
+        '--interactive', '-i',
         action='store_true',
-        help='Enable verbose output (ignored if --unattended is used)'
+        help='Run in interactive mode for exploration and training'
     )
     
-    parser.add_argument(
+    mode_group.add_argument(
         '--unattended', '-u',
         action='store_true',
         help='Silent unattended mode - minimal output, no summary (for scripts/automation)'
@@ -191,12 +240,170 @@ def get_string_input(prompt: str, default: str = "", required: bool = False, ava
             sys.exit(130)
 
 
-def get_available_fabs(db: Database) -> List[str]:
-    """Get available fabs from database."""
+# Fabs ('F'), scenarios ('S') and per-fab toolsets ('T') in one round trip.
+# DISTINCT is kept only for tb_runs, which has one row per run; scenario names
+# and toolset IDs are (near-)unique, so they are deduplicated client-side
+# instead of paying for a server-side sort/hash.
+METADATA_SQL = """
+    SELECT DISTINCT 'F' AS k, fab AS v, NULL AS fab FROM tb_runs
+    UNION ALL
+    SELECT 'S', name, NULL FROM scenarios
+    UNION ALL
+    SELECT 'T', toolset_id, fab FROM toolsets
+    ORDER BY 1, 2
+    """
+
+_Metadata = namedtuple('_Metadata', 'fabs scenarios toolsets_by_fab')
+
+# Option lists loaded by get_available_metadata; the get_available_* lookups
+# read from here instead of querying once it is set
+_metadata: Optional[_Metadata] = None
+
+
+def get_available_metadata(db: Database) -> Optional[_Metadata]:
+    """
+    Fetch fabs, scenarios and toolsets with a single query and keep them for
+    the session. Returns None (lookups keep querying) if the query fails.
+    """
+    global _metadata
+    if _metadata is not None:
+        return _metadata
+    
     try:
-        sql = "SELECT DISTINCT fab FROM tb_runs ORDER BY fab"
-        results = db.query(sql)
-        fabs = [row[0] for row in results] if results else []
+        rows = db.query(METADATA_SQL)
+    except Exception as e:
+        print(f"Warning: Could not retrieve options from database: {e}")
+        return None
+    
+    fabs = []
+    scenarios = []
+    toolsets_by_fab = {}
+    for kind, value, fab in rows:
+        if kind == 'F':
+            fabs.append(value)
+        elif kind == 'S':
+            scenarios.append(value)
+        else:
+            toolsets_by_fab.setdefault(fab, []).append(value)
+    
+    _metadata = _Metadata(
+        fabs,
+        _unique(scenarios),
+        {fab: _unique(toolsets) for fab, toolsets in toolsets_by_fab.items()}
+    )
+    return _metadata
+
+
+def _unique(values: List[str]) -> List[str]:
+    """Drop duplicates, keeping first-seen (query) order."""
+    return list(dict.fromkeys(values))
+
+
+FABS_SQL = "SELECT DISTINCT fab FROM tb_runs ORDER BY fab"
+SCENARIOS_SQL = "SELECT name FROM scenarios ORDER BY name"
+TOOLSETS_SQL = "SELECT toolset_id FROM toolsets WHERE fab = ? ORDER BY toolset_id"
+
+# On-disk copy of the option lookups, per database, served immediately and
+# refreshed in the background once older than LOOKUP_CACHE_TTL seconds
+LOOKUP_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "path-analysis", "metadata.json")
+LOOKUP_CACHE_TTL = 3600
+
+# Lookups already resolved in this process, by cache key
+_lookup_cache: Dict[str, List[str]] = {}
+_disk_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _cache_target() -> str:
+    """Identify the database the lookups come from, so each one gets its own disk entries."""
+    from config import JDBC_URL, DB_USER
+    return f"{DB_USER}@{JDBC_URL}"
+
+
+def _disk_key(key: str) -> str:
+    return f"{_cache_target()} {key}"
+
+
+def _read_disk_cache() -> dict:
+    """Load the on-disk lookup cache ({disk key: {'saved_at', 'values'}}), or {} if unreadable."""
+    try:
+        with open(LOOKUP_CACHE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_disk_cache(key: str, values: List[str]):
+    """Store one lookup in the on-disk cache; failures only cost the next run a query."""
+    with _disk_cache_lock:
+        cache = _read_disk_cache()
+        cache[_disk_key(key)] = {'saved_at': time.time(), 'values': values}
+        try:
+            os.makedirs(os.path.dirname(LOOKUP_CACHE_PATH), exist_ok=True)
+            tmp_path = f"{LOOKUP_CACHE_PATH}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, LOOKUP_CACHE_PATH)
+        except OSError:
+            pass
+
+
+def _query_lookup(db: Optional[Database], sql: str, params: list = None) -> List[str]:
+    """Run a single-column lookup, on a short-lived connection when db is None."""
+    if db is None:
+        db = _services().Database()
+        try:
+            return _query_lookup(db, sql, params)
+        finally:
+            db.close()
+    
+    # Prepared once per connection, so repeated lookups skip the server-side parse
+    return _unique(db.query_column_prepared(sql, params))
+
+
+def _refresh_lookup(key: str, db: Database, sql: str, params: Optional[list]):
+    """Re-run a lookup on db and rewrite its cache entry (stale copy kept on error)."""
+    try:
+        values = _query_lookup(db, sql, params)
+    except Exception:
+        return
+    _lookup_cache[key] = values
+    _write_disk_cache(key, values)
+
+
+def _cached_lookup(key: str, db: Optional[Database], sql: str, params: list = None) -> List[str]:
+    """
+    Stale-while-revalidate lookup: return the in-process or on-disk copy if
+    there is one (refreshing a stale disk copy on a background thread through
+    db's pool), otherwise query and cache the result. Without a db, a stale
+    copy is treated as missing.
+    """
+    if key in _lookup_cache:
+        return _lookup_cache[key]
+    
+    entry = _read_disk_cache().get(_disk_key(key))
+    stale = entry is not None and time.time() - entry['saved_at'] > LOOKUP_CACHE_TTL
+    if entry is None or (stale and db is None):
+        values = _lookup_cache[key] = _query_lookup(db, sql, params)
+        _write_disk_cache(key, values)
+        return values
+    
+    values = _lookup_cache[key] = entry['values']
+    if stale:
+        threading.Thread(target=_refresh_lookup, args=(key, db, sql, params), daemon=True).start()
+    return values
+
+
+def get_available_fabs(db: Optional[Database] = None) -> List[str]:
+    """
+    Get available fabs from database (or the lookup cache). A connection is
+    opened only if db is None and the fabs are not cached.
+    """
+    try:
+        if _metadata is not None:
+            fabs = _metadata.fabs
+        else:
+            fabs = _cached_lookup('fabs', db, FABS_SQL)
         
         # Add some common default fabs if none found
         if not fabs:
@@ -207,12 +414,13 @@ def get_available_fabs(db: Database) -> List[str]:
         return ["M16", "M15", "M14", "M13"]  # Default options
 
 
-def get_available_scenarios(db: Database) -> List[str]:
-    """Get available scenarios from database."""
+def get_available_scenarios(db: Optional[Database] = None) -> List[str]:
+    """Get available scenarios from database (or the lookup cache)."""
     try:
-        sql = "SELECT DISTINCT name FROM scenarios ORDER BY name"
-        results = db.query(sql)
-        scenarios = [row[0] for row in results] if results else []
+        if _metadata is not None:
+            scenarios = _metadata.scenarios
+        else:
+            scenarios = _cached_lookup('scenarios', db, SCENARIOS_SQL)
         
         # Add some default options if none found
         if not scenarios:
@@ -223,12 +431,13 @@ def get_available_scenarios(db: Database) -> List[str]:
         return ["test-scenario-01", "test-scenario-02", "validation-suite"]
 
 
-def get_available_toolsets(db: Database, fab: str) -> List[str]:
-    """Get available toolsets for a specific fab."""
+def get_available_toolsets(db: Optional[Database], fab: str) -> List[str]:
+    """Get available toolsets for a specific fab (from database or the lookup cache)."""
     try:
-        sql = "SELECT DISTINCT toolset_id FROM toolsets WHERE fab = ? ORDER BY toolset_id"
-        results = db.query(sql, [fab])
-        toolsets = [row[0] for row in results] if results else []
+        if _metadata is not None:
+            toolsets = _metadata.toolsets_by_fab.get(fab, [])
+        else:
+            toolsets = _cached_lookup(f"toolsets:{fab}", db, TOOLSETS_SQL, [fab])
         
         # Add "ALL" option and empty option
         options = ["ALL", ""]
@@ -243,34 +452,54 @@ def get_available_toolsets(db: Database, fab: str) -> List[str]:
         return ["ALL", "", "TOOLSET_001", "TOOLSET_002", "TOOLSET_003"]
 
 
-def validate_approach_specific_args(approach: Approach, args) -> None:
-    """Validate that approach-specific arguments are provided correctly."""
+# Warnings for RANDOM-only arguments given with SCENARIO, in the order
+# (fab, toolset, method, coverage-target) checked by validate_approach_specific_args
+_SCENARIO_IGNORED_ARG_WARNINGS = (
+    "Warning: --fab is ignored for SCENARIO approach",
+    "Warning: --toolset is ignored for SCENARIO approach",
+    "Warning: --method is ignored for SCENARIO approach (determined by scenario code)",
+    "Warning: --coverage-target is ignored for SCENARIO approach (scenarios have predefined coverage)",
+)
+
+
+def validate_approach_specific_args(approach: Approach, args,
+                                    warn: Optional[Callable[[str], None]] = print) -> None:
+    """
+    Validate that approach-specific arguments are provided correctly.
+    Warnings about ignored arguments go to warn (None suppresses them).
+    """
     if approach == Approach.SCENARIO:
-        # SCENARIO approach doesn't use fab/toolset/coverage-target/method
-        if args.fab:
-            print(f"Warning: --fab is ignored for SCENARIO approach")
-        if args.toolset:
-            print(f"Warning: --toolset is ignored for SCENARIO approach")
-        if args.method:
-            print(f"Warning: --method is ignored for SCENARIO approach (determined by scenario code)")
-        if args.coverage_target != 0.2:  # Only warn if explicitly set
-            print(f"Warning: --coverage-target is ignored for SCENARIO approach (scenarios have predefined coverage)")
+        # SCENARIO approach doesn't use fab/toolset/method/coverage-target
+        # (coverage target only warns if explicitly set)
+        ignored = (args.fab, args.toolset, args.method, args.coverage_target != 0.2)
+        if warn and any(ignored):
+            for is_set, warning in zip(ignored, _SCENARIO_IGNORED_ARG_WARNINGS):
+                if is_set:
+                    warn(warning)
         
         # SCENARIO approach needs exactly one scenario identifier
-        scenario_args = [args.by_code, args.by_file]
-        if not any(scenario_args):
+        by_code, by_file = args.by_code, args.by_file
+        if not (by_code or by_file):
             raise ValueError("SCENARIO approach requires either --by-code or --by-file")
         
         # Only one scenario identifier should be provided
-        provided_args = [arg for arg in scenario_args if arg]
-        if len(provided_args) > 1:
+        if by_code and by_file:
             raise ValueError("SCENARIO approach: only one of --by-code or --by-file should be provided")
     
     elif approach == Approach.RANDOM:
         # RANDOM approach doesn't use scenario arguments
-        scenario_args = [args.by_code, args.by_file]
-        if any(scenario_args):
-            print(f"Warning: scenario arguments (--by-code, --by-file) are ignored for RANDOM approach")
+        if warn and (args.by_code or args.by_file):
+            warn("Warning: scenario arguments (--by-code, --by-file) are ignored for RANDOM approach")
+
+
+# Allowed method names per approach
+_RANDOM_METHODS = frozenset({'SIMPLE', 'STRATIFIED'})
+_SCENARIO_METHODS = frozenset({'PREDEFINED', 'SYNTHETIC'})
+_VALID_METHODS = {Approach.RANDOM: _RANDOM_METHODS, Approach.SCENARIO: _SCENARIO_METHODS}
+
+# Enum value -> member lookups, bypassing EnumMeta.__call__
+_APPROACH_MAP = {a.value: a for a in Approach}
+_METHOD_MAP = {m.value: m for m in Method}
 
 
 def validate_method_for_approach(approach: Approach, method: Optional[str]) -> Method:
@@ -278,9 +507,7 @@ def validate_method_for_approach(approach: Approach, method: Optional[str]) -> M
     if approach == Approach.RANDOM:
         if method is None:
             return Method.SIMPLE
-        if method.upper() not in ['SIMPLE', 'STRATIFIED']:
-            raise ValueError(f"Invalid method '{method}' for RANDOM approach. Use SIMPLE or STRATIFIED.")
-        return Method(method.upper())
+        return validate_method(approach, method)
     
     elif approach == Approach.SCENARIO:
         # For SCENARIO approach, method is determined by the scenario code/type
@@ -291,184 +518,201 @@ def validate_method_for_approach(approach: Approach, method: Optional[str]) -> M
         raise ValueError(f"Unknown approach: {approach}")
 
 
+# Scenario code prefix -> scenario method
+_SCENARIO_CODE_PREFIXES = {"PRE": Method.PREDEFINED, "SYN": Method.SYNTHETIC}
+
+
 def detect_scenario_method_from_code(scenario_code: str) -> Method:
     """Detect scenario method from the scenario code pattern."""
-    if scenario_code.startswith("PRE"):
-        return Method.PREDEFINED
-    elif scenario_code.startswith("SYN"):
-        return Method.SYNTHETIC
-    else:
-        # Default to PREDEFINED for unknown patterns
-        return Method.PREDEFINED
+    # Default to PREDEFINED for unknown patterns
+    return _SCENARIO_CODE_PREFIXES.get(scenario_code[:3], Method.PREDEFINED)
 
 
 def validate_method(approach: Approach, method: str) -> Method:
     """Validate and return the appropriate method for the given approach."""
-    if approach == Approach.RANDOM:
-        if method.upper() not in ['SIMPLE', 'STRATIFIED']:
-            raise ValueError(f"Invalid method '{method}' for RANDOM approach. Use SIMPLE or STRATIFIED.")
-        return Method(method.upper())
-    
-    elif approach == Approach.SCENARIO:
-        if method.upper() not in ['PREDEFINED', 'SYNTHETIC']:
-            raise ValueError(f"Invalid method '{method}' for SCENARIO approach. Use PREDEFINED or SYNTHETIC.")
-        return Method(method.upper())
-    
-    else:
+    valid_methods = _VALID_METHODS.get(approach)
+    if valid_methods is None:
         raise ValueError(f"Unknown approach: {approach}")
+    
+    method_upper = method.upper()
+    if method_upper not in valid_methods:
+        raise ValueError(f"Invalid method '{method}' for {approach.value} approach. "
+                         f"Use {' or '.join(sorted(valid_methods))}.")
+    return _METHOD_MAP[method_upper]
 
 
 def print_configuration_summary(config: RunConfig, scenario_code: str = "", scenario_file: str = ""):
     """Print configuration summary."""
-    print(f"\n{'='*60}")
-    print(f"CONFIGURATION SUMMARY")
-    print(f"{'='*60}")
-    print(f"Run ID: {config.run_id}")
-    print(f"Approach: {config.approach.value}")
+    lines = [
+        "",
+        "=" * 60,
+        "CONFIGURATION SUMMARY",
+        "=" * 60,
+        f"Run ID: {config.run_id}",
+        f"Approach: {config.approach.value}",
+    ]
     
     if config.approach == Approach.RANDOM:
-        print(f"Method: {config.method.value}")
-        print(f"Coverage Target: {config.coverage_target:.1%}")
-        print(f"Fab: {config.fab}")
+        lines.append(f"Method: {config.method.value}")
+        lines.append(f"Coverage Target: {config.coverage_target:.1%}")
+        lines.append(f"Fab: {config.fab}")
         if config.toolset:
-            print(f"Toolset: {config.toolset}")
+            lines.append(f"Toolset: {config.toolset}")
     elif config.approach == Approach.SCENARIO:
-        print(f"Type: {config.method.value} (auto-detected)")
-        print(f"Coverage: Predefined by scenario")
+        lines.append(f"Type: {config.method.value} (auto-detected)")
+        lines.append("Coverage: Predefined by scenario")
         if scenario_code:
-            print(f"Scenario Code: {scenario_code}")
+            lines.append(f"Scenario Code: {scenario_code}")
         if scenario_file:
-            print(f"Scenario File: {scenario_file}")
+            lines.append(f"Scenario File: {scenario_file}")
+    
+    lines.append(f"Tag: {config.tag}")
+    lines.append(f"Started: {config.started_at.strftime('%Y-%m-%d %H:%M:%S')}")
     
-    print(f"Tag: {config.tag}")
-    print(f"Started: {config.started_at.strftime('%Y-%m-%d %H:%M:%S')}")
+    # One write for the whole block instead of one print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_run_summary(result: RunResult, verbose: bool = False):
     """Print run summary to console."""
-    print(f"\n{'='*60}")
-    print(f"RUN SUMMARY")
-    print(f"{'='*60}")
-    print(f"Run ID: {result.run_id}")
-    print(f"Approach: {result.approach.value}")
-    print(f"Method: {result.method.value}")
-    print(f"Fab: {result.fab}")
-    print(f"Tag: {result.tag}")
-    print(f"Status: {result.status.value}")
-    print(f"Duration: {result.duration:.2f}s")
+    lines = [
+        "",
+        "=" * 60,
+        "RUN SUMMARY",
+        "=" * 60,
+        f"Run ID: {result.run_id}",
+        f"Approach: {result.approach.value}",
+        f"Method: {result.method.value}",
+        f"Fab: {result.fab}",
+        f"Tag: {result.tag}",
+        f"Status: {result.status.value}",
+        f"Duration: {result.duration:.2f}s",
+    ]
     
     if result.approach == Approach.RANDOM:
-        print(f"\nCOVERAGE RESULTS:")
-        print(f"Target Coverage: {result.coverage_target:.1%}")
-        print(f"Achieved Coverage: {result.total_coverage:.1%}")
+        lines.append("\nCOVERAGE RESULTS:")
+        lines.append(f"Target Coverage: {result.coverage_target:.1%}")
+        lines.append(f"Achieved Coverage: {result.total_coverage:.1%}")
     else:
-        print(f"\nSCENARIO RESULTS:")
-        print(f"Scenarios Executed: {result.paths_found}")
+        lines.append("\nSCENARIO RESULTS:")
+        lines.append(f"Scenarios Executed: {result.paths_found}")
     
-    print(f"Total Nodes: {result.total_nodes:,}")
-    print(f"Total Links: {result.total_links:,}")
+    lines.append(f"Total Nodes: {result.total_nodes:,}")
+    lines.append(f"Total Links: {result.total_links:,}")
     
     if verbose and result.errors:
-        print(f"\nERRORS ({len(result.errors)}):")
-        for error in result.errors[:10]:  # Show first 10 errors
-            print(f"  - {error}")
-        if len(result.errors) > 10:
-            print(f"  ... and {len(result.errors) - 10} more errors")
+        errors = result.errors
+        error_count = len(errors)
+        lines.append(f"\nERRORS ({error_count}):")
+        lines.extend(f"  - {error}" for error in itertools.islice(errors, 10))  # Show first 10 errors
+        if error_count > 10:
+            lines.append(f"  ... and {error_count - 10} more errors")
     
     if verbose and result.review_flags:
-        print(f"\nREVIEW FLAGS ({len(result.review_flags)}):")
-        for flag in result.review_flags[:5]:  # Show first 5 flags
-            print(f"  - {flag}")
-        if len(result.review_flags) > 5:
-            print(f"  ... and {len(result.review_flags) - 5} more flags")
-
-
-def execute_run_with_config(config: RunConfig, scenario_code: str = "", scenario_file: str = "", verbose: bool = False) -> RunResult:
-    """Execute a run with the given configuration."""
-    # Initialize database and services
-    db = Database()
-    try:
-        run_service = RunService(db)
-        path_service = PathService(db)
-        coverage_service = CoverageService(db)
-        
-        # Pass scenario parameters if this is a SCENARIO approach
-        if config.approach == Approach.SCENARIO:
-            # TODO: Pass scenario_code and scenario_file to the run service
-            # For now, these will be stored in the config or passed separately
-            pass
-        
-        result = run_service.execute_run(config, path_service, coverage_service, verbose=verbose)
-        return result
+        flags = result.review_flags
+        flag_count = len(flags)
+        lines.append(f"\nREVIEW FLAGS ({flag_count}):")
+        lines.extend(f"  - {flag}" for flag in itertools.islice(flags, 5))  # Show first 5 flags
+        if flag_count > 5:
+            lines.append(f"  ... and {flag_count - 5} more flags")
+    
+    # One write for the whole block instead of one print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def execute_run_with_config(config: RunConfig, db: Database, scenario_code: str = "", scenario_file: str = "",
+                            verbose: bool = False) -> RunResult:
+    """Execute a run with the given configuration on the caller's database connection."""
+    # Initialize services
+    svc = _services()
+    run_service = svc.RunService(db)
+    path_service = svc.PathService(db)
+    coverage_service = svc.CoverageService(db)
+    
+    # Pass scenario parameters if this is a SCENARIO approach
+    if config.approach == Approach.SCENARIO:
+        # TODO: Pass scenario_code and scenario_file to the run service
+        # For now, these will be stored in the config or passed separately
+        pass
+    
+    result = run_service.execute_run(config, path_service, coverage_service, verbose=verbose)
+    return result
+
+
+def build_config(args, db: Database, log: Optional[Callable[[str], None]] = None) -> Tuple[RunConfig, str, str]:
+    """
+    Build the run configuration from command line arguments (shared by default
+    and unattended mode). Returns (config, scenario_code, scenario_file).
+    Warnings, and notes when --verbose is set, go to log; None keeps it silent.
+    """
+    approach = args.approach
+    method = validate_method_for_approach(approach, args.method)
+    
+    # Validate approach-specific arguments
+    validate_approach_specific_args(approach, args, warn=log)
+    note = log if args.verbose else None
+    
+    # Handle approach-specific configuration
+    fab = ""
+    toolset = ""
+    scenario_code = ""
+    scenario_file = ""
+    
+    if approach == Approach.RANDOM:
+        fab = args.fab or ""
+        toolset = args.toolset or ""
+        
+        # Get default fab if not provided (from the lookup cache when warm)
+        if not fab:
+            try:
+                available_fabs = get_available_fabs(db)
+                if available_fabs:
+                    fab = available_fabs[0]
+                    if note:
+                        note(f"No fab specified, using default: {fab}")
+                else:
+                    fab = "DEFAULT"
+                    if note:
+                        note(f"No fabs found in database, using: {fab}")
+            except Exception as e:
+                fab = "DEFAULT"
+                if note:
+                    note(f"Could not retrieve fabs from database, using: {fab}")
+    
+    elif approach == Approach.SCENARIO:
+        scenario_code = args.by_code or ""
+        scenario_file = args.by_file or ""
         
-    finally:
-        db.close()
+        # Auto-detect method from scenario code if provided
+        if scenario_code:
+            method = detect_scenario_method_from_code(scenario_code)
+    
+    # Generate configuration; the run ID and start time are taken only once
+    # every validation above has passed
+    coverage_target = args.coverage_target if approach == Approach.RANDOM else 0.0
+    run_id = new_run_id()
+    started_at = datetime.now()
+    config = RunConfig.create_with_auto_tag(
+        run_id=run_id,
+        approach=approach,
+        method=method,
+        coverage_target=coverage_target,
+        fab=fab,
+        toolset=toolset,
+        started_at=started_at
+    )
+    
+    return config, scenario_code, scenario_file
 
 
-def unattended_mode(args) -> None:
+def unattended_mode(args, db: Database) -> None:
     """Run the application in unattended mode (silent, for scripts/automation)."""
     try:
-        # Use the same configuration logic as default mode
-        approach = Approach(args.approach)
-        method = validate_method_for_approach(approach, args.method)
-        
-        # Validate approach-specific arguments (but suppress warnings in unattended mode)
-        if approach == Approach.SCENARIO:
-            scenario_args = [args.by_code, args.by_file]
-            if not any(scenario_args):
-                print("error")
-                sys.exit(1)
-            provided_args = [arg for arg in scenario_args if arg]
-            if len(provided_args) > 1:
-                print("error")
-                sys.exit(1)
-        
-        # Handle approach-specific configuration
-        fab = ""
-        toolset = ""
-        scenario_code = ""
-        scenario_file = ""
-        
-        if approach == Approach.RANDOM:
-            fab = args.fab or ""
-            toolset = args.toolset or ""
-            
-            # Get default fab if not provided (silently)
-            if not fab:
-                db = Database()
-                try:
-                    available_fabs = get_available_fabs(db)
-                    if available_fabs:
-                        fab = available_fabs[0]
-                    else:
-                        fab = "DEFAULT"
-                except Exception:
-                    fab = "DEFAULT"
-                finally:
-                    db.close()
-        
-        elif approach == Approach.SCENARIO:
-            scenario_code = args.by_code or ""
-            scenario_file = args.by_file or ""
-            
-            # Auto-detect method from scenario code if provided
-            if scenario_code:
-                method = detect_scenario_method_from_code(scenario_code)
-        
-        # Generate configuration
-        coverage_target = args.coverage_target if approach == Approach.RANDOM else 0.0
-        config = RunConfig.create_with_auto_tag(
-            run_id=str(uuid.uuid4()),
-            approach=approach,
-            method=method,
-            coverage_target=coverage_target,
-            fab=fab,
-            toolset=toolset,
-            started_at=datetime.now()
-        )
+        # Same configuration logic as default mode, without warnings or notes
+        config, scenario_code, scenario_file = build_config(args, db)
         
         # Execute the run (always silent and non-verbose in unattended mode)
-        result = execute_run_with_config(config, scenario_code, scenario_file, verbose=False)
+        result = execute_run_with_config(config, db, scenario_code, scenario_file, verbose=False)
         
         # Silent output - just status
         if result.status == RunStatus.DONE:
@@ -484,65 +728,10 @@ def unattended_mode(args) -> None:
         sys.exit(1)
 
 
-def default_mode(args) -> None:
+def default_mode(args, db: Database) -> None:
     """Run the application in default mode (quick test with optional parameters)."""
     try:
-        # Configuration logic
-        approach = Approach(args.approach)
-        method = validate_method_for_approach(approach, args.method)
-        
-        # Validate approach-specific arguments
-        validate_approach_specific_args(approach, args)
-        
-        # Handle approach-specific configuration
-        fab = ""
-        toolset = ""
-        scenario_code = ""
-        scenario_file = ""
-        
-        if approach == Approach.RANDOM:
-            fab = args.fab or ""
-            toolset = args.toolset or ""
-            
-            # Get default fab if not provided
-            if not fab:
-                db = Database()
-                try:
-                    available_fabs = get_available_fabs(db)
-                    if available_fabs:
-                        fab = available_fabs[0]
-                        if args.verbose:
-                            print(f"No fab specified, using default: {fab}")
-                    else:
-                        fab = "DEFAULT"
-                        if args.verbose:
-                            print(f"No fabs found in database, using: {fab}")
-                except Exception as e:
-                    fab = "DEFAULT"
-                    if args.verbose:
-                        print(f"Could not retrieve fabs from database, using: {fab}")
-                finally:
-                    db.close()
-        
-        elif approach == Approach.SCENARIO:
-            scenario_code = args.by_code or ""
-            scenario_file = args.by_file or ""
-            
-            # Auto-detect method from scenario code if provided
-            if scenario_code:
-                method = detect_scenario_method_from_code(scenario_code)
-        
-        # Generate configuration
-        coverage_target = args.coverage_target if approach == Approach.RANDOM else 0.0
-        config = RunConfig.create_with_auto_tag(
-            run_id=str(uuid.uuid4()),
-            approach=approach,
-            method=method,
-            coverage_target=coverage_target,
-            fab=fab,
-            toolset=toolset,
-            started_at=datetime.now()
-        )
+        config, scenario_code, scenario_file = build_config(args, db, log=print)
         
         # Output based on verbosity
         if args.verbose:
@@ -551,15 +740,16 @@ def default_mode(args) -> None:
             print(f"\nStarting analysis run...")
         else:
             # Standard mode - brief message
-            if approach == Approach.RANDOM:
-                fab_display = f" for {fab}" if fab and fab != "DEFAULT" else ""
-                print(f"Starting {approach.value} {method.value} analysis{fab_display} (target: {coverage_target:.1%})")
+            if config.approach == Approach.RANDOM:
+                fab_display = f" for {config.fab}" if config.fab and config.fab != "DEFAULT" else ""
+                print(f"Starting {config.approach.value} {config.method.value} analysis{fab_display} "
+                      f"(target: {config.coverage_target:.1%})")
             else:
                 scenario_display = scenario_code or scenario_file or "default"
-                print(f"Starting {approach.value} analysis with {scenario_display}")
+                print(f"Starting {config.approach.value} analysis with {scenario_display}")
         
         # Execute the run
-        result = execute_run_with_config(config, scenario_code, scenario_file, args.verbose)
+        result = execute_run_with_config(config, db, scenario_code, scenario_file, args.verbose)
         
         # Print results
         print_run_summary(result, verbose=args.verbose)
@@ -577,29 +767,28 @@ def default_mode(args) -> None:
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         if args.verbose:
-            import traceback
             traceback.print_exc()
         sys.exit(1)
 
 
-def interactive_mode():
+def interactive_mode(db: Database):
     """Run the application in interactive mode."""
     print("=" * 60)
     print("PATH ANALYSIS CLI TOOL")
     print("=" * 60)
     print("Welcome! This tool will guide you through setting up a path analysis run.")
     
-    # Initialize database connection for options lookup
-    db = Database()
-    
     try:
+        # Load fab, scenario and toolset options in one round trip
+        get_available_metadata(db)
+        
         # 1. Select approach
         approach_str = get_user_choice(
             "Select analysis approach:",
             ["RANDOM", "SCENARIO"],
             default_idx=0
         )
-        approach = Approach(approach_str)
+        approach = _APPROACH_MAP[approach_str]
         
         # 2. Select method based on approach
         if approach == Approach.RANDOM:
@@ -688,9 +877,18 @@ def interactive_mode():
                 method = detect_scenario_method_from_code(scenario_code)
                 print(f"Auto-detected scenario type: {method.value}")
         
-        # 5. Generate tag and create configuration
+        # 5. Verbose option
+        verbose_choice = get_user_choice(
+            "\nEnable verbose output?",
+            ["No", "Yes"],
+            default_idx=0
+        )
+        verbose = verbose_choice == "Yes"
+        
+        # 6. Generate tag and create configuration once all input is in;
+        # this is the config shown below and the one that runs
         config = RunConfig.create_with_auto_tag(
-            run_id=str(uuid.uuid4()),
+            run_id=new_run_id(),
             approach=approach,
             method=method,
             coverage_target=coverage_target,
@@ -699,14 +897,6 @@ def interactive_mode():
             started_at=datetime.now()
         )
         
-        # 6. Verbose option
-        verbose_choice = get_user_choice(
-            "\nEnable verbose output?",
-            ["No", "Yes"],
-            default_idx=0
-        )
-        verbose = verbose_choice == "Yes"
-        
         # Show configuration and confirm
         print_configuration_summary(config, scenario_code, scenario_file)
         
@@ -724,7 +914,7 @@ def interactive_mode():
         print(f"\nStarting analysis run...")
         print(f"This may take several minutes depending on coverage target and network size.")
         
-        result = execute_run_with_config(config, scenario_code, scenario_file, verbose)
+        result = execute_run_with_config(config, db, scenario_code, scenario_file, verbose)
         
         # Print results
         print_run_summary(result, verbose=verbose)
@@ -741,8 +931,6 @@ def interactive_mode():
     except Exception as e:
         print(f"\nError: {e}", file=sys.stderr)
         sys.exit(1)
-    finally:
-        db.close()
 
 
 def main():
@@ -750,20 +938,33 @@ def main():
     parser = create_parser()
     args = parser.parse_args()
     
+    # One connection for the whole invocation (option lookups and the run);
+    # --help and argument errors have already exited without opening it
+    try:
+        db = _services().Database()
+    except Exception as e:
+        if args.unattended:
+            print("error")
+        else:
+            print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    
     # Determine mode based on arguments
     try:
         if args.interactive:
             # Interactive mode for exploration/training
-            interactive_mode()
+            interactive_mode(db)
         elif args.unattended:
             # Unattended mode for scripts/automation (always silent)
-            unattended_mode(args)
+            unattended_mode(args, db)
         else:
             # Default mode (quick test) - handles normal operations
-            default_mode(args)
+            default_mode(args, db)
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
         sys.exit(130)
+    finally:
+        db.close()
 
 
 if __name__ == "__main__":
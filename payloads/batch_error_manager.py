@@ -4,8 +4,14 @@ Batch Error Manager
 Handles logging and management of batch processing errors.
 """
 
+import atexit
+import base64
 import json
+import queue
+import threading
 import traceback
+import zlib
+from collections import Counter
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
@@ -14,6 +20,42 @@ from enum import Enum
 from db import Database
 
 
+# Shared encoder for record_data; json.dumps(..., default=str) would build a
+# new JSONEncoder on every call
+_RECORD_DATA_ENCODER = json.JSONEncoder(default=str, separators=(',', ':'))
+
+
+# record_data payloads longer than this (in bytes) are stored zlib-compressed
+# and base64-encoded, so the column stays TEXT
+RECORD_DATA_COMPRESS_THRESHOLD = 2048
+
+
+def _encode_record_data(text: str) -> tuple:
+    """Return (value, encoding) for record_data, compressing large payloads."""
+    raw = text.encode('utf-8')
+    if len(raw) > RECORD_DATA_COMPRESS_THRESHOLD:
+        return base64.b64encode(zlib.compress(raw, 6)).decode('ascii'), 'zlib'
+    return text, 'text'
+
+
+def _decode_record_data(value: Any, encoding: Optional[str]) -> Optional[str]:
+    """Inverse of _encode_record_data. Undecodable 'zlib' values are returned as stored."""
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        value = str(value)  # e.g. a CLOB wrapper from the driver
+    if encoding == 'zlib':
+        try:
+            return zlib.decompress(base64.b64decode(value)).decode('utf-8')
+        except (ValueError, zlib.error) as e:
+            print(f"Failed to decode compressed record_data: {e}")
+    return value
+
+
+# Queue item telling the writer thread to exit
+_STOP = object()
+
+
 class ErrorSeverity(Enum):
     """Error severity levels."""
     WARNING = "WARNING"
@@ -36,9 +78,29 @@ class ErrorType(Enum):
 class BatchErrorManager:
     """
     Manager for logging and retrieving batch processing errors.
+    
+    Logged errors are queued and written in batches by a background writer
+    thread on its own connection, so log_error() does not wait on the
+    database and the writer's commits never include uncommitted work on db.
+    Call flush() to wait for queued errors to be written and close() (or use
+    the manager as a context manager) to stop the writer; close() also runs
+    at interpreter exit.
     """
     
-    def __init__(self, db: Database, batch_type: str, batch_run_id: Optional[str] = None):
+    # Most errors queued before log_error() falls back to a synchronous insert
+    QUEUE_SIZE = 10_000
+    # Seconds the writer waits for more errors before writing a partial batch
+    FLUSH_INTERVAL = 0.1
+    
+    INSERT_ERROR_SQL = """
+        INSERT INTO tb_batch_errors (
+            batch_type, batch_run_id, error_type, error_code, error_message,
+            error_details, record_identifier, record_data, record_data_encoding, severity
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    def __init__(self, db: Database, batch_type: str, batch_run_id: Optional[str] = None,
+                 flush_threshold: int = 1000, writer_db: Optional[Database] = None):
         """
         Initialize the error manager.
         
@@ -46,13 +108,44 @@ class BatchErrorManager:
             db: Database instance
             batch_type: Type of batch process (e.g., 'toolsets', 'equipments')
             batch_run_id: Optional unique identifier for this batch run
+            flush_threshold: Most errors the writer thread inserts per batch
+            writer_db: Connection for the writer thread (default: a new
+                Database, closed by close()); must not be db
         """
         self.db = db
         self.batch_type = batch_type
         self.batch_run_id = batch_run_id or self._generate_batch_run_id()
-        self.error_count = 0
-        self.warning_count = 0
-        self.critical_count = 0
+        self.flush_threshold = flush_threshold
+        # ErrorSeverity -> number of errors written by this manager
+        self._counts: Counter = Counter()
+        # Set once rows are resolved/deleted here, so _counts no longer matches the table
+        self._counts_stale = False
+        self._q: queue.Queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        # Serializes writes on _writer_db from the writer thread and synchronous fallbacks
+        self._write_lock = threading.Lock()
+        self._write_failed = False
+        self._writer: Optional[threading.Thread] = None
+        
+        self._owns_writer_db = writer_db is None
+        self._writer_db = writer_db
+        if writer_db is None:
+            try:
+                self._writer_db = Database()
+            except Exception as e:
+                print(f"Failed to open error writer connection, logging errors synchronously: {e}")
+                return
+        
+        self._writer = threading.Thread(target=self._drain_loop, name=f"{batch_type}-error-writer",
+                                        daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+        return False
     
     def _generate_batch_run_id(self) -> str:
         """Generate a unique batch run ID."""
@@ -70,7 +163,10 @@ class BatchErrorManager:
         severity: ErrorSeverity = ErrorSeverity.ERROR
     ) -> bool:
         """
-        Log an error to the database.
+        Log an error to the database. The row is queued for the writer thread;
+        if the queue is full (or there is no writer) it is inserted
+        synchronously instead, so errors are never dropped. Severity counters
+        are updated once the row is written.
         
         Args:
             error_type: Type of error (use ErrorType enum values)
@@ -82,23 +178,19 @@ class BatchErrorManager:
             severity: Error severity level
             
         Returns:
-            True if error was logged successfully, False otherwise
+            True if error was queued or written, False otherwise
         """
         try:
             # Convert record_data to JSON string if it's a complex object
-            record_data_str = None
+            # (compressed when large, see _encode_record_data)
+            record_data_value = None
+            record_data_encoding = 'text'
             if record_data is not None:
                 if isinstance(record_data, (dict, list, tuple)):
-                    record_data_str = json.dumps(record_data, default=str)
+                    record_data_str = _RECORD_DATA_ENCODER.encode(record_data)
                 else:
                     record_data_str = str(record_data)
-            
-            insert_sql = """
-                INSERT INTO tb_batch_errors (
-                    batch_type, batch_run_id, error_type, error_code,
-                    error_message, error_details, record_identifier, record_data, severity
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
+                record_data_value, record_data_encoding = _encode_record_data(record_data_str)
             
             params = [
                 self.batch_type,
@@ -108,29 +200,127 @@ class BatchErrorManager:
                 error_message,
                 error_details,
                 record_identifier,
-                record_data_str,
+                record_data_value,
+                record_data_encoding,
                 severity.value
             ]
             
-            rows_affected = self.db.update(insert_sql, params)
+            item = (params, severity)
+            if self._writer is None:
+                return self._write([item])
+            try:
+                self._q.put_nowait(item)
+            except queue.Full:
+                # Back-pressure: write on the caller's thread rather than drop it
+                return self._write([item])
             
-            if rows_affected > 0:
-                # Update counters
-                if severity == ErrorSeverity.WARNING:
-                    self.warning_count += 1
-                elif severity == ErrorSeverity.CRITICAL:
-                    self.critical_count += 1
-                else:
-                    self.error_count += 1
-                
-                return True
+            return True
             
+        except Exception as e:
+            print(f"Failed to log error to database: {e}")
             return False
+    
+    @property
+    def warning_count(self) -> int:
+        return self._counts[ErrorSeverity.WARNING]
+    
+    @property
+    def error_count(self) -> int:
+        return self._counts[ErrorSeverity.ERROR]
+    
+    @property
+    def critical_count(self) -> int:
+        return self._counts[ErrorSeverity.CRITICAL]
+    
+    def _drain_loop(self):
+        """
+        Writer thread: take queued errors in batches of up to flush_threshold,
+        waiting at most FLUSH_INTERVAL for a batch to fill, until _STOP.
+        """
+        q = self._q
+        while True:
+            item = q.get()
+            batch = []
+            stop = item is _STOP
+            if not stop:
+                batch.append(item)
+            while not stop and len(batch) < self.flush_threshold:
+                try:
+                    item = q.get(timeout=self.FLUSH_INTERVAL)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
             
+            if batch and not self._write(batch):
+                self._write_failed = True
+            for _ in range(len(batch) + stop):
+                q.task_done()
+            if stop:
+                return
+    
+    def _write(self, batch: List[tuple]) -> bool:
+        """
+        Insert (params, severity) items in a single batched INSERT (one
+        transaction), through a prepared statement the database keeps for
+        later batches, and count them once written. Uses the writer
+        connection while it is open, otherwise db.
+        """
+        try:
+            with self._write_lock:
+                db = self._writer_db if self._writer_db is not None else self.db
+                db.update_many_prepared(self.INSERT_ERROR_SQL, [params for params, _ in batch])
+                self._counts.update(severity for _, severity in batch)
+            return True
         except Exception as e:
-            print(f"Failed to log error to database: {e}")
+            print(f"Failed to log {len(batch)} errors to database: {e}")
             return False
     
+    def flush(self) -> bool:
+        """
+        Wait until every queued error has been written.
+        
+        Returns:
+            True if all batches since the last flush were written, False otherwise
+        """
+        if self._writer is not None:
+            self._q.join()
+        ok, self._write_failed = not self._write_failed, False
+        return ok
+    
+    def close(self):
+        """
+        Write any queued errors, stop the writer thread and close its
+        connection. Call before closing the database; later errors are
+        inserted synchronously on db.
+        """
+        writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        atexit.unregister(self.close)
+        self._q.put(_STOP)
+        writer.join()
+        
+        # Rows queued by another thread while closing
+        leftover = []
+        while True:
+            try:
+                leftover.append(self._q.get_nowait())
+            except queue.Empty:
+                break
+        if leftover and not self._write(leftover):
+            self._write_failed = True
+        
+        with self._write_lock:
+            writer_db, self._writer_db = self._writer_db, None
+        if self._owns_writer_db:
+            try:
+                writer_db.close()
+            except Exception as e:
+                print(f"Failed to close error writer connection: {e}")
+    
     def log_validation_error(
         self,
         error_message: str,
@@ -211,6 +401,8 @@ class BatchErrorManager:
         Returns:
             List of error dictionaries
         """
+        self.flush()
+        
         try:
             where_clause = "WHERE batch_run_id = ?"
             params = [self.batch_run_id]
@@ -222,7 +414,7 @@ class BatchErrorManager:
                 SELECT 
                     id, batch_type, batch_run_id, error_type, error_code,
                     error_message, error_details, record_identifier, record_data,
-                    severity, resolved, created_at, updated_at
+                    severity, resolved, created_at, updated_at, record_data_encoding
                 FROM tb_batch_errors 
                 {where_clause}
                 ORDER BY created_at DESC
@@ -241,7 +433,7 @@ class BatchErrorManager:
                     'error_message': row[5],
                     'error_details': row[6],
                     'record_identifier': row[7],
-                    'record_data': row[8],
+                    'record_data': _decode_record_data(row[8], row[13]),
                     'severity': row[9],
                     'resolved': row[10],
                     'created_at': row[11],
@@ -255,13 +447,31 @@ class BatchErrorManager:
             print(f"Error retrieving batch errors: {e}")
             return []
     
-    def get_error_summary(self) -> Dict[str, int]:
+    def get_error_summary(self, force_refresh: bool = False) -> Dict[str, int]:
         """
         Get a summary of errors for the current batch run.
         
+        Served from the counters kept by log_error(); the table is only
+        queried when force_refresh is set (e.g. other processes write to the
+        same batch run) or errors were resolved/cleared through this manager.
+        
+        Args:
+            force_refresh: Count unresolved errors in the database instead
+            
         Returns:
             Dictionary with error counts by severity
         """
+        self.flush()
+        
+        if not (force_refresh or self._counts_stale):
+            counts = self._counts
+            return {
+                'WARNING': counts[ErrorSeverity.WARNING],
+                'ERROR': counts[ErrorSeverity.ERROR],
+                'CRITICAL': counts[ErrorSeverity.CRITICAL],
+                'TOTAL': sum(counts.values())
+            }
+        
         try:
             query = """
                 SELECT severity, COUNT(*) as count
@@ -308,6 +518,7 @@ class BatchErrorManager:
             """
             
             rows_affected = self.db.update(update_sql, [error_id])
+            self._counts_stale = True
             return rows_affected > 0
             
         except Exception as e:
@@ -337,6 +548,7 @@ class BatchErrorManager:
                 params = [self.batch_type]
             
             deleted_count = self.db.update(delete_sql, params)
+            self._counts_stale = True
             return deleted_count
             
         except Exception as e:
@@ -1,5 +1,127 @@
-from collections import defaultdict, deque
-from typing import List, Dict, Any, Optional, Set, Tuple
+from array import array
+from collections import deque
+from typing import List, Dict, Any, NamedTuple, Optional, Set, Tuple
+
+
+class PathLinkRecord(NamedTuple):
+    """One nw_path_links row; binds directly as an INSERT parameter tuple."""
+    seq: int
+    link_id: int
+    length: float
+    start_node_id: int
+    start_node_data_code: Any
+    start_node_utility_no: Any
+    end_node_id: int
+    end_node_data_code: Any
+    end_node_utility_no: Any
+    reverse: int  # 1 if the link is traversed end -> start
+    node_flag: str
+    # add group_no/sub_group_no if needed
+
+
+def _find_paths(
+    start: int,
+    ignore: int,
+    utility_no: int,
+    toolset_id: int,
+    poc_ok: Optional[bytearray],
+    data_code_targets: Set[int],
+    indptr: array,
+    nbr: array,
+    edge_link: array,
+    edge_cost: array,
+    nbr_utility_no: List[Any],
+    nbr_toolset_id: List[Any],
+    data_code: List[Any],
+    node_eq_poc: array,
+    ids: List[int],
+    links: List[Dict[str, Any]]
+) -> List[Tuple[List[int], List[Dict[str, Any]], float]]:
+    """
+    Depth-first search over the CSR arrays of a DownstreamFinder, using dense
+    node indices (ignore is -1 for none). poc_ok says which eq_poc_no codes
+    pass the eq_poc_no filter (None for no filter). ids and links map dense
+    node and link indices back to node IDs and link records for the
+    returned paths.
+
+    Backtracking: each path entry keeps a cursor into its CSR edge range
+    (walked from the end, in the order the old push-all-neighbors stack
+    popped them) and in_path marks the nodes on the current path, so the
+    cycle check is O(1) and the mark is cleared when the entry is popped.
+    """
+    all_paths = []
+    # The ignored node is marked as if on the path, so one test rejects both
+    in_path = bytearray(len(indptr) - 1)
+    if ignore >= 0:
+        in_path[ignore] = 1
+    in_path[start] = 1
+
+    # Loop-invariant filter switches
+    filter_utility = bool(utility_no)
+    filter_toolset = bool(toolset_id)
+    filter_poc = poc_ok is not None
+
+    # Current path, one entry per depth
+    path = [start]
+    cursors = [indptr[start + 1]]  # next edge to try is cursors[d] - 1
+    has_next = [False]             # some neighbor was eligible
+    costs = [0.0]
+    node_buf = [ids[start]]
+    link_buf: List[Dict[str, Any]] = []
+
+    while path:
+        depth = len(path) - 1
+        node = path[depth]
+        e = cursors[depth]
+        lo = indptr[node]
+        # Explore neighbors: advance to the next eligible one
+        while e > lo:
+            e -= 1
+            v = nbr[e]
+            if in_path[v]:
+                continue  # avoid cycles (and the ignored node)
+            # Node filter
+            if filter_utility and nbr_utility_no[e] != utility_no:
+                continue
+            if filter_toolset and nbr_toolset_id[e] != toolset_id:
+                continue
+            if filter_poc and not poc_ok[node_eq_poc[v]]:
+                continue
+            break
+        else:
+            # Neighbors exhausted; a leaf ends a path
+            if not has_next[depth]:
+                all_paths.append((node_buf[:], link_buf[:], costs[depth]))
+            in_path[node] = 0
+            path.pop()
+            cursors.pop()
+            has_next.pop()
+            costs.pop()
+            node_buf.pop()
+            if link_buf:
+                link_buf.pop()
+            continue
+
+        cursors[depth] = e
+        has_next[depth] = True
+        link = links[edge_link[e]]
+        total_cost = costs[depth] + edge_cost[e]
+
+        if data_code_targets and data_code[v] in data_code_targets:
+            # This is a target node, path ends here
+            all_paths.append(([*node_buf, ids[v]], [*link_buf, link], total_cost))
+            continue
+
+        in_path[v] = 1
+        path.append(v)
+        cursors.append(indptr[v + 1])
+        has_next.append(False)
+        costs.append(total_cost)
+        node_buf.append(ids[v])
+        link_buf.append(link)
+
+    return all_paths
+
 
 class DownstreamFinder:
     def __init__(
@@ -9,13 +131,69 @@ class DownstreamFinder:
     ):
         self.nodes = nodes  # {node_id: {...}}
         self.links = links
-        # Build adjacency list: node_id -> List of (link, to_node_id)
-        self.adj = defaultdict(list)
-        for link in links:
-            s, e = link['start_node_id'], link['end_node_id']
-            self.adj[s].append((link, e))
-            if link['is_bidirected']:
-                self.adj[e].append((link, s))
+
+        # Dense node index (position in nodes) used by the flat arrays below
+        self._ids: List[int] = list(nodes)
+        self._idx: Dict[int, int] = {node_id: i for i, node_id in enumerate(self._ids)}
+
+        # Node attribute columns, indexed by dense node index. Plain lists,
+        # since the values come straight from DB rows and may be NULL.
+        self._data_code = [node['data_code'] for node in nodes.values()]
+        self._utility_no = [node['utility_no'] for node in nodes.values()]
+        self._toolset_id = [node['toolset_id'] for node in nodes.values()]
+        # eq_poc_no is dictionary-encoded: node i has _eq_poc_values[_eq_poc_code[i]]
+        poc_codes: Dict[Any, int] = {}
+        self._eq_poc_code = array('q', (
+            poc_codes.setdefault(node['eq_poc_no'], len(poc_codes)) for node in nodes.values()
+        ))
+        self._eq_poc_values = list(poc_codes)
+
+        # Adjacency in CSR form: the edges leaving dense node i are
+        # indptr[i]:indptr[i + 1]. Per edge: neighbor, link index, cost and
+        # the neighbor's utility_no/toolset_id, copied here so the DFS
+        # filters read edge columns instead of going through the neighbor.
+        # Links with an endpoint missing from nodes can't be on any path
+        # (the node has no attributes to filter on), so they get no edges.
+        idx = self._idx
+        n_nodes = len(self._ids)
+        ends = []
+        for i, link in enumerate(links):
+            s = idx.get(link['start_node_id'])
+            e = idx.get(link['end_node_id'])
+            if s is not None and e is not None:
+                ends.append((i, s, e, link['is_bidirected']))
+
+        # First pass: out-degree, prefix-summed into indptr
+        indptr = [0] * (n_nodes + 1)
+        for _, s, e, bidirected in ends:
+            indptr[s + 1] += 1
+            if bidirected:
+                indptr[e + 1] += 1
+        for i in range(n_nodes):
+            indptr[i + 1] += indptr[i]
+
+        # Second pass: fill each node's edge range in link order
+        n_edges = indptr[n_nodes]
+        fill = indptr[:-1]
+        nbr = [0] * n_edges
+        edge_link = [0] * n_edges
+        for i, s, e, bidirected in ends:
+            k = fill[s]
+            fill[s] = k + 1
+            nbr[k] = e
+            edge_link[k] = i
+            if bidirected:
+                k = fill[e]
+                fill[e] = k + 1
+                nbr[k] = s
+                edge_link[k] = i
+
+        self._indptr = array('q', indptr)
+        self._nbr = array('q', nbr)
+        self._edge_link = array('q', edge_link)
+        self._edge_cost = array('d', [links[i]['cost'] for i in edge_link])
+        self._nbr_utility_no = [self._utility_no[v] for v in nbr]
+        self._nbr_toolset_id = [self._toolset_id[v] for v in nbr]
 
     def find_paths(
         self,
@@ -25,80 +203,61 @@ class DownstreamFinder:
         toolset_id: int = 0,
         eq_poc_no: str = '',
         data_codes: str = ''
-    ) -> List[List[Dict[str, Any]]]:
+    ) -> List[Tuple[List[int], List[Dict[str, Any]], float]]:
+        """
+        Find all downstream paths from start_node_id. Returns one
+        (node_seq, link_seq, total_cost) tuple per path, ending at a
+        data_codes target or at a node with no eligible neighbor.
+        """
         data_code_targets = {int(dc.strip()) for dc in data_codes.split(',') if dc.strip() and dc != '0'}
-        all_paths = []
-        stack = [([start_node_id], [], 0.0)]  # (node_seq, link_seq, total_cost)
-
-        while stack:
-            node_seq, link_seq, total_cost = stack.pop()
-            curr_node = node_seq[-1]
-            node = self.nodes[curr_node]
-            
-            # Stopping conditions (target, leaf)
-            is_leaf = True
-            if data_code_targets and node['data_code'] in data_code_targets and len(node_seq) > 1:
-                # This is a target node, path ends here (not start node itself)
-                all_paths.append((node_seq[:], link_seq[:], total_cost))
-                continue
+        ignore = self._idx.get(ignore_node_id, -1)
+        # The substring test runs once per distinct eq_poc_no value instead of once per edge
+        poc_ok = bytearray(
+            bool(value) and eq_poc_no in value for value in self._eq_poc_values
+        ) if eq_poc_no else None
 
-            # Explore neighbors
-            for link, nbr in self.adj[curr_node]:
-                if nbr == ignore_node_id:
-                    continue
-                # Node filter
-                nbr_node = self.nodes[nbr]
-                if utility_no and nbr_node['utility_no'] != utility_no:
-                    continue
-                if toolset_id and nbr_node['toolset_id'] != toolset_id:
-                    continue
-                if eq_poc_no and (not nbr_node['eq_poc_no'] or eq_poc_no not in nbr_node['eq_poc_no']):
-                    continue
-                if nbr in node_seq:
-                    continue  # avoid cycles
-
-                is_leaf = False
-                stack.append((
-                    node_seq + [nbr],
-                    link_seq + [link],
-                    total_cost + link['cost']
-                ))
-
-            # If leaf, add path
-            if is_leaf:
-                all_paths.append((node_seq[:], link_seq[:], total_cost))
-
-        return all_paths
+        return _find_paths(
+            self._idx[start_node_id], ignore, utility_no, toolset_id, poc_ok, data_code_targets,
+            self._indptr, self._nbr, self._edge_link, self._edge_cost,
+            self._nbr_utility_no, self._nbr_toolset_id, self._data_code, self._eq_poc_code,
+            self._ids, self.links
+        )
 
     def path_to_nw_pathlinks(
         self, node_seq: List[int], link_seq: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
+    ) -> List[PathLinkRecord]:
         """Convert a path to list of path_link records, including node_flags."""
         path_links = []
         n = len(node_seq)
-        for i, (start, end) in enumerate(zip(node_seq[:-1], node_seq[1:])):
-            link = link_seq[i]
-            # node_flag logic
-            if i == 0:
-                node_flag = 'S'  # Start
-            elif i == n - 2:
-                node_flag = 'E'  # End/target
-            else:
-                node_flag = 'I'
-            path_links.append({
-                'seq': i,
-                'link_id': link['id'],
-                'length': link['cost'],
-                'start_node_id': start,
-                'start_node_data_code': self.nodes[start]['data_code'],
-                'start_node_utility_no': self.nodes[start]['utility_no'],
-                'end_node_id': end,
-                'end_node_data_code': self.nodes[end]['data_code'],
-                'end_node_utility_no': self.nodes[end]['utility_no'],
-                'reverse': 0,  # If traversed backwards, set 1
-                'node_flag': node_flag
-                # add group_no/sub_group_no if needed
-            })
+        if n < 2:
+            return path_links
+        idx, data_code, utility_no = self._idx, self._data_code, self._utility_no
+        # Each link's end node is the next link's start node, so its
+        # attributes are looked up once and carried over
+        start = node_seq[0]
+        i_start = idx[start]
+        start_data_code, start_utility_no = data_code[i_start], utility_no[i_start]
+        # node_flag per link: Start, Intermediate..., End/target (a single link is 'S')
+        node_flags = ['I'] * (n - 1)
+        node_flags[-1] = 'E'
+        node_flags[0] = 'S'
+        for i, (end, link, node_flag) in enumerate(zip(node_seq[1:], link_seq, node_flags)):
+            i_end = idx[end]
+            end_data_code, end_utility_no = data_code[i_end], utility_no[i_end]
+            path_links.append(PathLinkRecord(
+                i,
+                link['id'],
+                link['cost'],
+                start,
+                start_data_code,
+                start_utility_no,
+                end,
+                end_data_code,
+                end_utility_no,
+                int(link['start_node_id'] != start),
+                node_flag
+            ))
+            start, start_data_code, start_utility_no = end, end_data_code, end_utility_no
         return path_links
 
 # --- Example Usage ---
@@ -118,4 +277,4 @@ class DownstreamFinder:
 # 4. For each path:
 # for node_seq, link_seq, total_cost in paths:
 #     path_links = finder.path_to_nw_pathlinks(node_seq, link_seq)
-#     # Insert into nw_paths, nw_path_links
+#     # Insert into nw_paths, nw_path_links (records bind as parameter tuples)
@@ -25,20 +25,22 @@ def find_downstream_path_dijkstra(
     print(f'  - Ignore nodes: {raw_ignore_node_ids}')
     print(f'  - Target data codes: {target_codes_set if target_codes_set else "None (leaf/boundary only)"}')
     
-    # Dijkstra's algorithm with early termination
+    # Dijkstra's algorithm with early termination. Entries are never removed
+    # from the heap: one that is stale (its node was since reached more
+    # cheaply) is skipped when popped, by comparing against distances.
+    inf = float('inf')
     distances = {self.start_node_id: 0.0}
     previous = {}  # node_id -> (previous_node_id, link_id, reverse)
-    visited = set()
     heap = [(0.0, self.start_node_id)]
-    ignore_node_ids = [int(item) for item in raw_ignore_node_ids.split(',') if item.strip()] if raw_ignore_node_ids else []
+    # Set, not list: checked for every popped node and passed to the neighbor/endpoint tests
+    ignore_node_ids = frozenset(int(item) for item in raw_ignore_node_ids.split(',') if item.strip()) if raw_ignore_node_ids else frozenset()
     
     while heap:
         current_dist, current_node = heapq.heappop(heap)
         
-        if current_node in visited:
+        # Stale entry, or node already settled
+        if current_dist > distances[current_node]:
             continue
-            
-        visited.add(current_node)
         
         # Skip ignored node (but don't mark as endpoint)
         if current_node in ignore_node_ids:
@@ -82,13 +84,13 @@ def find_downstream_path_dijkstra(
                     
                     return [path_result]
         
-        # Explore traversable neighbors
-        neighbors = self._get_traversable_neighbors(current_node, ignore_node_ids, visited)
+        # Explore traversable neighbors (settled ones never pass the distance check)
+        neighbors = self._get_traversable_neighbors(current_node, ignore_node_ids, ())
         
         for neighbor_id, link_id, cost, reverse in neighbors:
             new_dist = current_dist + cost
             
-            if neighbor_id not in distances or new_dist < distances[neighbor_id]:
+            if new_dist < distances.get(neighbor_id, inf):
                 distances[neighbor_id] = new_dist
                 previous[neighbor_id] = (current_node, link_id, reverse)
                 heapq.heappush(heap, (new_dist, neighbor_id))
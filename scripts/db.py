@@ -25,6 +25,8 @@ class Database:
             )
         except jaydebeapi.DatabaseError as e:
             raise RuntimeError(f"Failed to connect via JDBC: {e}")
+        # sql -> java.sql.PreparedStatement, see prepare()
+        self._statements = {}
 
     @contextmanager
     def cursor(self):
@@ -67,6 +69,46 @@ class Database:
             self._conn.commit()
             return cur.rowcount
 
+    def update_many(self, sql: str, seq_of_params: list) -> int:
+        """
+        Execute an INSERT / UPDATE / DELETE once per parameter list as a
+        single JDBC batch with one commit. Return number of affected rows.
+        """
+        if not seq_of_params:
+            return 0
+        with self.cursor() as cur:
+            cur.executemany(sql, seq_of_params)
+            self._conn.commit()
+            return cur.rowcount
+
+    def prepare(self, sql: str):
+        """
+        Return a java.sql.PreparedStatement for sql, preparing it only
+        on first use so the parse/plan is reused across calls.
+        """
+        stmt = self._statements.get(sql)
+        if stmt is None:
+            stmt = self._statements[sql] = self._conn.jconn.prepareStatement(sql)
+        return stmt
+
+    def update_many_prepared(self, sql: str, seq_of_params: list) -> int:
+        """
+        Like update_many, but binds the parameter lists onto a cached
+        prepared statement (see prepare()), so repeated batches of the
+        same statement skip the parse. Return number of affected rows.
+        """
+        if not seq_of_params:
+            return 0
+        stmt = self.prepare(sql)
+        stmt.clearBatch()
+        for params in seq_of_params:
+            for i, param in enumerate(params, 1):
+                stmt.setObject(i, param)
+            stmt.addBatch()
+        counts = stmt.executeBatch()
+        self._conn.commit()
+        return sum(count for count in counts if count > 0)
+
     def callproc(self, proc_name: str, params: list = None):
         """
         Call a stored procedure. If params is None, calls without arguments.
@@ -82,5 +124,11 @@ class Database:
         """
         Close the underlying JDBC connection.
         """
+        for stmt in getattr(self, '_statements', {}).values():
+            try:
+                stmt.close()
+            except Exception:
+                pass
+        self._statements = {}
         if hasattr(self, '_conn') and self._conn:
             self._conn.close()
@@ -348,6 +348,9 @@ def main():
         sys.exit(1)
         
     finally:
+        if error_manager:
+            # Write errors still buffered by the manager before the connection goes
+            error_manager.close()
         if db:
             print("\nClosing database connection...")
             db.close()
@@ -30,32 +30,23 @@ class CoverageService:
             links_covered=0,
             total_nodes=self._total_nodes,
             total_links=self._total_links,
-            coverage_percentage=0.0
+            coverage_percentage=0.0,
+            covered_nodes=self._covered_nodes,
+            covered_links=self._covered_links
         )
     
     def update_coverage(self, path_definition: PathDefinition, 
                        current_stats: CoverageStats) -> CoverageStats:
         """Update coverage with a new path and return updated statistics."""
         
-        # Extract nodes and links from path context
-        path_nodes = path_definition.path_context.get('nodes', [])
-        path_links = path_definition.path_context.get('links', [])
+        # Track new nodes and links from the packed path arrays
+        self._covered_nodes.update(path_definition.node_ids_arr)
+        self._covered_links.update(path_definition.link_ids_arr)
         
-        # Track new nodes and links
-        new_nodes = 0
-        new_links = 0
-        
-        for node_id in path_nodes:
-            if node_id not in self._covered_nodes:
-                self._covered_nodes.add(node_id)
-                new_nodes += 1
-        
-        for link_id in path_links:
-            if link_id not in self._covered_links:
-                self._covered_links.add(link_id)
-                new_links += 1
-        
-        # Calculate updated statistics
+        return self._current_stats()
+    
+    def _current_stats(self) -> CoverageStats:
+        """Build statistics from the current covered sets."""
         total_covered = len(self._covered_nodes) + len(self._covered_links)
         total_possible = self._total_nodes + self._total_links
         coverage_percentage = total_covered / total_possible if total_possible > 0 else 0.0
@@ -65,7 +56,9 @@ class CoverageService:
             links_covered=len(self._covered_links),
             total_nodes=self._total_nodes,
             total_links=self._total_links,
-            coverage_percentage=coverage_percentage
+            coverage_percentage=coverage_percentage,
+            covered_nodes=self._covered_nodes,
+            covered_links=self._covered_links
         )
     
     def get_uncovered_areas(self, fab: str) -> dict:
@@ -87,20 +80,10 @@ class CoverageService:
     
     def calculate_path_coverage_contribution(self, path_definition: PathDefinition) -> float:
         """Calculate how much coverage a path would add."""
-        path_nodes = path_definition.path_context.get('nodes', [])
-        path_links = path_definition.path_context.get('links', [])
-        
-        new_coverage = 0
-        
-        # Count new nodes
-        for node_id in path_nodes:
-            if node_id not in self._covered_nodes:
-                new_coverage += 1
-        
-        # Count new links
-        for link_id in path_links:
-            if link_id not in self._covered_links:
-                new_coverage += 1
+        # Count new nodes and links
+        covered_nodes, covered_links = self._covered_nodes, self._covered_links
+        new_coverage = (sum(1 for node_id in path_definition.node_ids_arr if node_id not in covered_nodes) +
+                        sum(1 for link_id in path_definition.link_ids_arr if link_id not in covered_links))
         
         total_possible = self._total_nodes + self._total_links
         return new_coverage / total_possible if total_possible > 0 else 0.0
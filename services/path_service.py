@@ -13,8 +13,49 @@ from db import Database
 class PathService:
     """Service for managing path definitions and storage."""
     
+    # Rows buffered before attempt paths are written as one batch
+    BATCH_SIZE = 500
+    
+    INSERT_ATTEMPT_PATH_SQL = """
+        INSERT INTO tb_attempt_paths (
+            run_id, path_definition_id, start_node_id, end_node_id,
+            fab, category, utility, picked_at, notes
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+    
     def __init__(self, db: Database):
         self.db = db
+        self._pending_attempt_paths: List[list] = []
+    
+    def queue_path_attempt(self, run_id: str, path_result: PathResult) -> Optional[int]:
+        """
+        Store the path definition and queue its attempt record for a batched insert.
+        Returns the path definition ID (attempt IDs are not available until flushed).
+        """
+        if not path_result.path_found or not path_result.path_definition:
+            return None
+        
+        path_def = path_result.path_definition
+        path_def_id = self._store_path_definition(path_def)
+        if not path_def_id:
+            return None
+        
+        self._pending_attempt_paths.append(self._attempt_path_params(run_id, path_def_id, path_def))
+        if len(self._pending_attempt_paths) >= self.BATCH_SIZE:
+            self.flush_attempt_paths()
+        
+        return path_def_id
+    
+    def flush_attempt_paths(self):
+        """Write all queued attempt records in a single batched INSERT."""
+        pending, self._pending_attempt_paths = self._pending_attempt_paths, []
+        if not pending:
+            return
+        
+        try:
+            self.db.update_many(self.INSERT_ATTEMPT_PATH_SQL, pending)
+        except Exception as e:
+            print(f"Error storing {len(pending)} attempt paths: {e}")
     
     def store_path_attempt(self, run_id: str, path_result: PathResult) -> Optional[int]:
         """Store a path attempt in the database."""
@@ -52,7 +93,7 @@ class PathService:
         try:
             # Serialize utilities and context as JSON
             utilities_json = json.dumps(path_def.utilities)
-            path_context_json = json.dumps(path_def.path_context)
+            path_context_json = path_def.encoded_path_context()
             scenario_context_json = json.dumps(path_def.scenario_context) if path_def.scenario_context else None
             
             rows_affected = self.db.update(sql, [
@@ -93,32 +134,9 @@ class PathService:
     
     def _store_attempt_path(self, run_id: str, path_def_id: int, path_def: PathDefinition) -> Optional[int]:
         """Store an attempt path record."""
-        sql = """
-        INSERT INTO tb_attempt_paths (
-            run_id, path_definition_id, start_node_id, end_node_id,
-            fab, category, utility, picked_at, notes
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        
         try:
-            # Extract start/end nodes from path context
-            start_node = path_def.path_context.get('start_node_id')
-            end_node = path_def.path_context.get('end_node_id')
-            
-            # Get primary utility (first one if multiple)
-            utility = path_def.utilities[0] if path_def.utilities else 'UNKNOWN'
-            
-            rows_affected = self.db.update(sql, [
-                run_id,
-                path_def_id,
-                start_node,
-                end_node,
-                path_def.fab,
-                path_def.category,
-                utility,
-                datetime.now(),
-                f"Path found with {path_def.node_count} nodes, {path_def.link_count} links"
-            ])
+            rows_affected = self.db.update(self.INSERT_ATTEMPT_PATH_SQL,
+                                           self._attempt_path_params(run_id, path_def_id, path_def))
             
             if rows_affected > 0:
                 # Get the generated ID
@@ -131,6 +149,28 @@ class PathService:
             print(f"Error storing attempt path: {e}")
             return None
     
+    @staticmethod
+    def _attempt_path_params(run_id: str, path_def_id: int, path_def: PathDefinition) -> list:
+        """Bind parameters for one tb_attempt_paths row."""
+        # Extract start/end nodes from path context
+        start_node = path_def.path_context.get('start_node_id')
+        end_node = path_def.path_context.get('end_node_id')
+        
+        # Get primary utility (first one if multiple)
+        utility = path_def.utilities[0] if path_def.utilities else 'UNKNOWN'
+        
+        return [
+            run_id,
+            path_def_id,
+            start_node,
+            end_node,
+            path_def.fab,
+            path_def.category,
+            utility,
+            datetime.now(),
+            f"Path found with {path_def.node_count} nodes, {path_def.link_count} links"
+        ]
+    
     def get_path_definition(self, path_def_id: int) -> Optional[PathDefinition]:
         """Retrieve a path definition by ID."""
         sql = """
@@ -162,7 +202,8 @@ class PathService:
                 coverage=row[8],
                 utilities=utilities,
                 path_context=path_context,
-                scenario_context=scenario_context
+                scenario_context=scenario_context,
+                path_context_json=row[10] if row[10] else None
             )
             
         except Exception as e:
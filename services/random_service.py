@@ -283,10 +283,11 @@ class RandomService:
     
     def _generate_path_hash(self, path_context: Dict) -> str:
         """Generate a unique hash for the path."""
-        # Create a deterministic string representation
-        hash_input = f"{path_context['start_node_id']}-{path_context['end_node_id']}-"
-        hash_input += "-".join(map(str, sorted(path_context['nodes'])))
-        hash_input += "-" + "-".join(map(str, sorted(path_context['links'])))
+        # Deterministic string representation; the format must not change, since
+        # stored path_hash values are matched to dedupe path definitions
+        nodes = "-".join(map(str, sorted(path_context['nodes'])))
+        links = "-".join(map(str, sorted(path_context['links'])))
+        hash_input = f"{path_context['start_node_id']}-{path_context['end_node_id']}-{nodes}-{links}"
         
         return hashlib.sha256(hash_input.encode()).hexdigest()
     
@@ -2,6 +2,7 @@
 Service for managing analysis run execution.
 """
 
+import threading
 import time
 from datetime import datetime
 from typing import List, Optional
@@ -23,8 +24,13 @@ class RunService:
         self.validation_service = ValidationService(db)
     
     def execute_run(self, config: RunConfig, path_service: PathService, 
-                   coverage_service: CoverageService, verbose: bool = False) -> RunResult:
-        """Execute a complete analysis run."""
+                   coverage_service: CoverageService, verbose: bool = False,
+                   cancel_event: Optional[threading.Event] = None) -> RunResult:
+        """
+        Execute a complete analysis run. Setting cancel_event stops random
+        sampling after the current attempt; the partial result is stored as
+        FAILED. Scenario runs are not cancellable and run to completion.
+        """
         start_time = time.time()
         
         # Initialize run in database
@@ -32,28 +38,34 @@ class RunService:
         
         try:
             if config.approach == Approach.RANDOM:
-                result = self._execute_random_run(config, path_service, coverage_service, verbose)
+                result = self._execute_random_run(config, path_service, coverage_service, verbose, cancel_event)
             elif config.approach == Approach.SCENARIO:
                 result = self._execute_scenario_run(config, path_service, coverage_service, verbose)
             else:
                 raise ValueError(f"Unsupported approach: {config.approach}")
             
+            # Write any batched rows still queued
+            self._flush_pending(path_service)
+            
             # Update run status
             end_time = time.time()
             result.ended_at = datetime.now()
             result.duration = end_time - start_time
-            result.status = RunStatus.DONE
+            # A cancelled sampling loop has already marked its result FAILED
+            if result.status != RunStatus.FAILED:
+                result.status = RunStatus.DONE
             
             self._update_run_record(result)
             self._create_run_summary(result)
             
-            if verbose:
+            if verbose and result.status == RunStatus.DONE:
                 print(f"Run completed successfully in {result.duration:.2f}s")
             
             return result
             
         except Exception as e:
             # Handle failure
+            self._flush_pending(path_service)
             end_time = time.time()
             result = RunResult(
                 run_id=config.run_id,
@@ -79,8 +91,14 @@ class RunService:
             
             raise
     
+    def _flush_pending(self, path_service: PathService):
+        """Flush batched attempt paths and validation errors."""
+        path_service.flush_attempt_paths()
+        self.validation_service.flush_validation_errors()
+    
     def _execute_random_run(self, config: RunConfig, path_service: PathService,
-                          coverage_service: CoverageService, verbose: bool = False) -> RunResult:
+                          coverage_service: CoverageService, verbose: bool = False,
+                          cancel_event: Optional[threading.Event] = None) -> RunResult:
         """Execute a random sampling run."""
         if verbose:
             print(f"Executing {config.method.value} random sampling...")
@@ -113,6 +131,11 @@ class RunService:
         while (result.total_coverage < config.coverage_target and 
                attempts < max_attempts):
             
+            if cancel_event is not None and cancel_event.is_set():
+                result.status = RunStatus.FAILED
+                result.errors.append(f"Run cancelled after {attempts} attempts")
+                break
+            
             attempts += 1
             
             if verbose and attempts % 100 == 0:
@@ -132,19 +155,19 @@ class RunService:
                 )
                 result.total_coverage = new_coverage.coverage_percentage
                 
-                # Store path
-                path_service.store_path_attempt(config.run_id, path_result)
+                # Store path (attempt record is written in batches)
+                path_service.queue_path_attempt(config.run_id, path_result)
                 
                 # Validate path
                 validation_errors = self.validation_service.validate_path(
                     config.run_id, path_result.path_definition
                 )
-                result.errors.extend([str(e) for e in validation_errors])
+                result.errors.extend(map(str, validation_errors))
                 
             else:
                 # Handle path not found
-                result.errors.extend([str(e) for e in path_result.errors])
-                result.review_flags.extend([str(f) for f in path_result.review_flags])
+                result.errors.extend(map(str, path_result.errors))
+                result.review_flags.extend(map(str, path_result.review_flags))
         
         if attempts >= max_attempts:
             result.errors.append(f"Maximum attempts ({max_attempts}) reached")
@@ -14,9 +14,21 @@ from db import Database
 class ValidationService:
     """Service for path validation and consistency checking."""
     
+    # Rows buffered before validation errors are written as one batch
+    BATCH_SIZE = 500
+    
+    INSERT_VALIDATION_ERROR_SQL = """
+        INSERT INTO tb_validation_errors (
+            run_id, path_definition_id, validation_test_id, severity,
+            error_scope, error_type, object_type, node_id, link_id,
+            category, utility, material, flow, item_name, created_at, notes
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+    
     def __init__(self, db: Database):
         self.db = db
         self._validation_tests = self._load_validation_tests()
+        self._pending_validation_errors: List[ValidationError] = []
     
     def validate_path(self, run_id: str, path_definition: PathDefinition) -> List[ValidationError]:
         """Perform comprehensive validation on a path."""
@@ -33,9 +45,17 @@ class ValidationService:
         errors.extend(self._validate_material_consistency(run_id, path_definition, nodes, links))
         errors.extend(self._validate_path_integrity(run_id, path_definition, nodes, links))
         
-        # Store validation errors in database
-        for error in errors:
-            self._store_validation_error(error)
+        # One timestamp for every error found on this path
+        if errors:
+            now = datetime.now()
+            for error in errors:
+                if error.created_at is None:
+                    error.created_at = now
+        
+        # Queue validation errors; they are written in batches
+        self._pending_validation_errors.extend(errors)
+        if len(self._pending_validation_errors) >= self.BATCH_SIZE:
+            self.flush_validation_errors()
         
         return errors
     
@@ -279,38 +299,48 @@ class ValidationService:
         
         return errors
     
-    def _store_validation_error(self, error: ValidationError):
-        """Store a validation error in the database."""
-        sql = """
-        INSERT INTO tb_validation_errors (
-            run_id, path_definition_id, validation_test_id, severity,
-            error_scope, error_type, object_type, node_id, link_id,
-            category, utility, material, flow, item_name, created_at, notes
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
+    def flush_validation_errors(self):
+        """Write all queued validation errors in a single batched INSERT."""
+        pending, self._pending_validation_errors = self._pending_validation_errors, []
+        if not pending:
+            return
         
         try:
-            self.db.update(sql, [
-                error.run_id,
-                error.path_definition_id,
-                error.validation_test_id,
-                error.severity.value,
-                error.error_scope,
-                error.error_type.value,
-                error.object_type.value,
-                error.node_id,
-                error.link_id,
-                error.category,
-                error.utility,
-                error.material,
-                error.flow,
-                error.item_name,
-                error.created_at,
-                error.notes
+            self.db.update_many(self.INSERT_VALIDATION_ERROR_SQL, [
+                self._validation_error_params(error) for error in pending
             ])
+        except Exception as e:
+            print(f"Error storing {len(pending)} validation errors: {e}")
+    
+    def _store_validation_error(self, error: ValidationError):
+        """Store a validation error in the database."""
+        try:
+            self.db.update(self.INSERT_VALIDATION_ERROR_SQL, self._validation_error_params(error))
         except Exception as e:
             print(f"Error storing validation error: {e}")
     
+    @staticmethod
+    def _validation_error_params(error: ValidationError) -> list:
+        """Bind parameters for one tb_validation_errors row."""
+        return [
+            error.run_id,
+            error.path_definition_id,
+            error.validation_test_id,
+            error.severity.value,
+            error.error_scope,
+            error.error_type.value,
+            error.object_type.value,
+            error.node_id,
+            error.link_id,
+            error.category,
+            error.utility,
+            error.material,
+            error.flow,
+            error.item_name,
+            error.created_at or datetime.now(),
+            error.notes
+        ]
+    
     def _load_validation_tests(self) -> Dict[str, dict]:
         """Load validation test definitions from database."""
         sql = """
@@ -5,11 +5,16 @@ Final version with simplified fab-based implementation and updated phase handlin
 """
 
 import argparse
+import functools
+import hashlib
 import sys
 import uuid
 from datetime import datetime
+from pathlib import Path
 from typing import Optional, List, Union # Added Union
 
+import jaydebeapi
+
 from enums import Approach, Method, RunStatus, ExecutionMode, Phase, ScenarioType # Added ScenarioType
 from models import RunConfig, RunResult
 from services.run_service import RunService
@@ -19,6 +24,26 @@ from services.simple_random_service import SimplePopulationService # Assumed thi
 from db import Database
 
 
+_BANNER = "=" * 60
+
+# Fallbacks used when the lookup tables are empty or unreachable
+_DEFAULT_FABS = ("M16", "M15", "M15X")
+_DEFAULT_SCENARIOS = ("PRE001", "SYN001")
+_EXAMPLE_TOOLSETS = ("TS001_Example", "TS002_Example")
+
+# PHASE1 / A / 1 -> Phase.PHASE1, built once at import so phase resolution is a plain dict lookup
+_PHASE_NORMALIZE = {
+    **{p.conceptual: p for p in Phase},
+    **{p.nominal: p for p in Phase},
+    **{str(p.cardinal): p for p in Phase},
+}
+
+# Fabs already populated by SimplePopulationService; marker files (one directory per database)
+# let later CLI invocations skip it too
+_populated_fabs = set()
+_POPULATED_MARKER_DIR = Path.home() / ".cache" / "path-analysis"
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create command line argument parser."""
     parser = argparse.ArgumentParser(
@@ -130,18 +155,18 @@ Examples:
 
 def fetch_user_choice(prompt: str, choices: List[str], default_idx: int = 0) -> str:
     """Get user choice from a list of options."""
-    print(f"\n{prompt}")
-    for i, choice in enumerate(choices, 1):
-        marker = " (default)" if i - 1 == default_idx else ""
-        print(f"  {i}. {choice}{marker}")
+    n_choices = len(choices)
+    listing = "\n".join(f"  {i}. {choice}{' (default)' if i - 1 == default_idx else ''}" for i, choice in enumerate(choices, 1))
+    input_prompt = f"\nEnter choice (1-{n_choices}) [default: {default_idx + 1}]: "
+    print(f"\n{prompt}\n{listing}") # Listing is rendered once; retries only print the error line
     
     while True:
         try:
-            user_input = input(f"\nEnter choice (1-{len(choices)}) [default: {default_idx + 1}]: ").strip()
+            user_input = input(input_prompt).strip()
             if not user_input: return choices[default_idx]
             choice_idx = int(user_input) - 1
-            if 0 <= choice_idx < len(choices): return choices[choice_idx]
-            else: print(f"Invalid choice. Please enter a number between 1 and {len(choices)}.")
+            if 0 <= choice_idx < n_choices: return choices[choice_idx]
+            print(f"Invalid choice. Please enter a number between 1 and {n_choices}.")
         except ValueError: print("Invalid input. Please enter a number.")
         except KeyboardInterrupt: print("\nOperation cancelled by user."); sys.exit(130)
 
@@ -164,6 +189,7 @@ def fetch_string_input(prompt: str, default: str = "", required: bool = False, a
     full_prompt = prompt
     if default: full_prompt += f" [default: {default}]"
     full_prompt += ": "
+    options_set = frozenset(available_options) if available_options else frozenset() # O(1) membership; list kept for ordered display
 
     while True:
         try:
@@ -171,7 +197,7 @@ def fetch_string_input(prompt: str, default: str = "", required: bool = False, a
                 print(f"\n{prompt}")
                 # Create a temporary list for display and selection if options are numerous
                 display_options = available_options
-                if len(available_options) > 10 and not required and (default=="" or default not in available_options): # Add "None" for optional with many choices
+                if len(available_options) > 10 and not required and (default=="" or default not in options_set): # Add "None" for optional with many choices
                     display_options = ["None"] + available_options
                 
                 for i, option in enumerate(display_options, 1):
@@ -199,10 +225,10 @@ def fetch_string_input(prompt: str, default: str = "", required: bool = False, a
                 
                 # If not a number or invalid number, treat as direct string input
                 # Validate against original available_options if it's a typed input
-                if user_input in available_options: return user_input
+                if user_input in options_set: return user_input
                 if not available_options and user_input: return user_input # Allow any string if no options given
                 if not user_input and required: print("This field is required."); continue
-                if user_input and available_options and user_input not in available_options:
+                if user_input and available_options and user_input not in options_set:
                     print(f"Invalid input. '{user_input}' is not in the available options. Please choose from the list or type an exact match.")
                     continue # Re-prompt
                 if not user_input and not default and not required: return ""
@@ -221,29 +247,25 @@ def fetch_string_input(prompt: str, default: str = "", required: bool = False, a
 
 def fetch_available_fabs(db: Database) -> List[str]:
     """Get available fabs from tb_toolsets."""
-    try:
-        results = db.query("SELECT DISTINCT fab FROM tb_toolsets WHERE is_active = TRUE ORDER BY fab")
-        return [row[0] for row in results] if results else ["M16", "M15", "M15X"] # Default fallback
-    except Exception: return ["M16", "M15", "M15X"]
+    try: fabs = db.query_column("SELECT DISTINCT fab FROM tb_toolsets WHERE is_active = TRUE ORDER BY fab")
+    except jaydebeapi.DatabaseError: fabs = None
+    return fabs if fabs else list(_DEFAULT_FABS)
 
 
 def fetch_available_scenarios(db: Database) -> List[str]:
     """Get available scenario codes from tb_scenarios."""
-    try:
-        results = db.query("SELECT code FROM tb_scenarios WHERE is_active = TRUE ORDER BY code")
-        return [row[0] for row in results] if results else ["PRE001", "SYN001"] # Default fallback
-    except Exception: return ["PRE001", "SYN001"]
+    try: codes = db.query_column("SELECT code FROM tb_scenarios WHERE is_active = TRUE ORDER BY code")
+    except jaydebeapi.DatabaseError: codes = None
+    return codes if codes else list(_DEFAULT_SCENARIOS)
 
 
 def fetch_available_toolsets(db: Database, fab: str) -> List[str]:
     """Get available toolsets for a specific fab from tb_toolsets."""
     options = ["ALL"] # "ALL" is always an option
-    try:
-        if fab: # Only query if fab is specified
-            results = db.query("SELECT DISTINCT code FROM tb_toolsets WHERE fab = ? AND is_active = TRUE ORDER BY code", [fab])
-            if results: options.extend([row[0] for row in results])
-    except Exception: pass # Fallback to just "ALL" or add hardcoded defaults
-    if len(options) == 1: options.extend(["TS001_Example", "TS002_Example"]) # Add if DB empty
+    if fab: # Only query if fab is specified
+        try: options.extend(db.query_column("SELECT DISTINCT code FROM tb_toolsets WHERE fab = ? AND is_active = TRUE ORDER BY code", [fab]))
+        except jaydebeapi.DatabaseError: pass # Fallback to just "ALL" plus example toolsets
+    if len(options) == 1: options.extend(_EXAMPLE_TOOLSETS) # Add if DB empty
     return options
 
 
@@ -252,31 +274,31 @@ def fetch_available_phases(db: Database, fab: str) -> List[str]: # Returns human
     # Phases are A, B, C, D in DB. Convert to PHASE1 etc for user.
     human_readable_phases: List[str] = []
     default_phases = [p.conceptual for p in Phase.phases()] # ["PHASE1", "PHASE2", ...]
-    try:
-        if fab: # Only query if fab is specified
-            results = db.query("SELECT DISTINCT phase FROM tb_toolsets WHERE fab = ? AND is_active = TRUE ORDER BY phase", [fab])
-            if results:
-                db_phases = {row[0] for row in results} # set of 'A', 'B' etc.
-                for phase_enum_member in Phase: # Iterate through PHASE1, PHASE2...
-                    if phase_enum_member.nominal in db_phases: # Check if 'A' is in db_phases
-                        human_readable_phases.append(phase_enum_member.conceptual) # Add "PHASE1"
-        return human_readable_phases if human_readable_phases else default_phases
-    except Exception: return default_phases
+    if fab: # Only query if fab is specified
+        try: db_phases = set(db.query_column("SELECT DISTINCT phase FROM tb_toolsets WHERE fab = ? AND is_active = TRUE ORDER BY phase", [fab])) # set of 'A', 'B' etc.
+        except jaydebeapi.DatabaseError: return default_phases
+        for phase_enum_member in Phase: # Iterate through PHASE1, PHASE2...
+            if phase_enum_member.nominal in db_phases: # Check if 'A' is in db_phases
+                human_readable_phases.append(phase_enum_member.conceptual) # Add "PHASE1"
+    return human_readable_phases if human_readable_phases else default_phases
 
 
 def validate_approach_specific_args(approach_enum: Approach, args: argparse.Namespace, verbose: bool):
-    """Validate arguments based on approach. Warn if ignored."""
+    """Validate arguments based on approach. Warn if ignored (verbose only)."""
+    if approach_enum == Approach.SCENARIO:
+        if not (args.scenario_code or args.scenario_file):
+            raise ValueError("SCENARIO approach requires either --scenario-code or --scenario-file.")
+        if args.scenario_code and args.scenario_file:
+            raise ValueError("SCENARIO approach: provide only one of --scenario-code or --scenario-file.")
+
+    if not verbose: return # Only mandatory checks when warnings would not be shown (unattended hot path)
+
     warnings = []
     if approach_enum == Approach.SCENARIO:
         ignored_for_scenario = {'fab': args.fab, 'toolset': args.toolset, 'phase': args.phase, 'method': args.method}
         if args.coverage_target != 0.2: ignored_for_scenario['coverage_target'] = args.coverage_target # Only if not default
         for arg_name, arg_val in ignored_for_scenario.items():
             if arg_val: warnings.append(f"--{arg_name.replace('_','-')} is ignored for SCENARIO approach.")
-        
-        if not (args.scenario_code or args.scenario_file):
-            raise ValueError("SCENARIO approach requires either --scenario-code or --scenario-file.")
-        if args.scenario_code and args.scenario_file:
-            raise ValueError("SCENARIO approach: provide only one of --scenario-code or --scenario-file.")
     
     elif approach_enum == Approach.RANDOM:
         ignored_for_random = {'scenario_code': args.scenario_code, 'scenario_file': args.scenario_file}
@@ -285,7 +307,7 @@ def validate_approach_specific_args(approach_enum: Approach, args: argparse.Name
         # Fab is usually required for RANDOM unless handled by a default elsewhere
         # if not args.fab: raise ValueError("RANDOM approach typically requires --fab.")
 
-    if verbose and warnings:
+    if warnings:
         print("Argument Warnings:")
         for warn in warnings: print(f"  - {warn}")
 
@@ -313,72 +335,106 @@ def determine_method(approach_enum: Approach, args_method_str: Optional[str], sc
     raise ValueError(f"Cannot determine method for approach {approach_enum.value}")
 
 
+def resolve_phase_input(phase_input_str: Optional[str]) -> Optional[Phase]:
+    """Resolve phase input string (PHASE1, A, 1, ...) to a Phase member or None."""
+    if not phase_input_str: return None
+    phase_enum = _PHASE_NORMALIZE.get(phase_input_str.upper().strip())
+    return phase_enum if phase_enum is not None else Phase.normalize(phase_input_str) # Fallback for unexpected formats
+
+
 def normalize_phase_input(phase_input_str: Optional[str]) -> str: # Returns system nominal (A,B,C,D) or ""
     """Normalize phase input string to system nominal (A, B, C, D) or empty string."""
-    if not phase_input_str: return ""
-    phase_enum = Phase.normalize(phase_input_str)
+    phase_enum = resolve_phase_input(phase_input_str)
     return phase_enum.nominal if phase_enum else ""
 
 
 def print_configuration_summary(config: RunConfig):
-    print(f"\n{'='*60}\nCONFIGURATION SUMMARY\n{'='*60}")
-    print(f"Run ID: {config.run_id}\nApproach: {config.approach.value}")
+    lines = ["", _BANNER, "CONFIGURATION SUMMARY", _BANNER,
+             f"Run ID: {config.run_id}", f"Approach: {config.approach.value}"]
     
     if config.approach == Approach.RANDOM:
-        print(f"Method: {config.method.value}\nCoverage Target: {config.coverage_target:.1%}")
-        print(f"Fab: {config.building_code if config.building_code else 'Not Specified (using default)'}")
+        lines += [f"Method: {config.method.value}", f"Coverage Target: {config.coverage_target:.1%}",
+                  f"Fab: {config.building_code if config.building_code else 'Not Specified (using default)'}"]
         if config.phase: # config.phase is 'A', 'B', etc.
-            phase_enum = Phase.normalize(config.phase)
-            display_phase = phase_enum.conceptual if phase_enum else config.phase # Display PHASE1
-            print(f"Phase: {display_phase} (System: {config.phase})")
-        if config.toolset: print(f"Toolset: {config.toolset}")
+            display_phase = config.phase_enum.conceptual if config.phase_enum else config.phase # Display PHASE1
+            lines.append(f"Phase: {display_phase} (System: {config.phase})")
+        if config.toolset: lines.append(f"Toolset: {config.toolset}")
     
     elif config.approach == Approach.SCENARIO:
-        print(f"Method (Scenario Type): {config.method.value}") # Method now reflects PREDEFINED/SYNTHETIC
-        if config.scenario_code: print(f"Scenario Code: {config.scenario_code}")
-        if config.scenario_file: print(f"Scenario File: {config.scenario_file}")
+        lines.append(f"Method (Scenario Type): {config.method.value}") # Method now reflects PREDEFINED/SYNTHETIC
+        if config.scenario_code: lines.append(f"Scenario Code: {config.scenario_code}")
+        if config.scenario_file: lines.append(f"Scenario File: {config.scenario_file}")
     
-    print(f"Execution Mode: {config.execution_mode.value}\nVerbose Mode: {config.verbose_mode}")
-    print(f"Tag: {config.tag}\nStarted: {config.started_at.strftime('%Y-%m-%d %H:%M:%S')}")
+    lines += [f"Execution Mode: {config.execution_mode.value}", f"Verbose Mode: {config.verbose_mode}",
+              f"Tag: {config.tag}", f"Started: {config.started_at.strftime('%Y-%m-%d %H:%M:%S')}"]
+    sys.stdout.write("\n".join(lines) + "\n") # Single write instead of one print() per line
 
 
 def print_run_summary(result: RunResult, verbose: bool = False):
-    print(f"\n{'='*60}\nRUN SUMMARY\n{'='*60}")
-    print(f"Run ID: {result.run_id}\nApproach: {result.approach.value}\nMethod: {result.method.value}")
-    if result.building_code: print(f"Fab: {result.building_code}")
-    print(f"Tag: {result.tag}\nStatus: {result.status.value}\nDuration: {result.duration:.2f}s")
+    lines = ["", _BANNER, "RUN SUMMARY", _BANNER,
+             f"Run ID: {result.run_id}", f"Approach: {result.approach.value}", f"Method: {result.method.value}"]
+    if result.building_code: lines.append(f"Fab: {result.building_code}")
+    lines += [f"Tag: {result.tag}", f"Status: {result.status.value}", f"Duration: {result.duration:.2f}s"]
 
     if result.approach == Approach.RANDOM:
-        print(f"\nCOVERAGE RESULTS (RANDOM):")
-        print(f"  Target Coverage: {result.coverage_target:.1%}")
-        print(f"  Achieved Coverage: {result.total_coverage:.1%}")
-        print(f"  Paths Attempted: {result.paths_attempted}\n  Paths Found: {result.paths_found}")
-        print(f"  Total Nodes in Fab: {result.total_nodes:,}\n  Total Links in Fab: {result.total_links:,}")
+        lines += ["", "COVERAGE RESULTS (RANDOM):",
+                  f"  Target Coverage: {result.coverage_target:.1%}",
+                  f"  Achieved Coverage: {result.total_coverage:.1%}",
+                  f"  Paths Attempted: {result.paths_attempted}", f"  Paths Found: {result.paths_found}",
+                  f"  Total Nodes in Fab: {result.total_nodes:,}", f"  Total Links in Fab: {result.total_links:,}"]
     else: # SCENARIO
-        print(f"\nSCENARIO RESULTS:")
-        print(f"  Scenarios Executed: {result.scenario_tests}\n  Scenarios Successful: {result.paths_found}")
-        print(f"  Success Rate: {result.total_coverage:.1%}") # total_coverage is success rate for scenarios
-        print(f"  Total Nodes in Paths: {result.total_nodes:,}\n  Total Links in Paths: {result.total_links:,}")
+        lines += ["", "SCENARIO RESULTS:",
+                  f"  Scenarios Executed: {result.scenario_tests}", f"  Scenarios Successful: {result.paths_found}",
+                  f"  Success Rate: {result.total_coverage:.1%}", # total_coverage is success rate for scenarios
+                  f"  Total Nodes in Paths: {result.total_nodes:,}", f"  Total Links in Paths: {result.total_links:,}"]
 
     if verbose:
         for error_type, errors_list_str in [
             ("ERRORS", result.errors), ("REVIEW FLAGS", result.review_flags), ("CRITICAL ERRORS", result.critical_errors)
         ]:
             if errors_list_str:
-                print(f"\n{error_type} ({len(errors_list_str)}):")
-                for item_str in errors_list_str[:5]: print(f"  - {item_str}")
-                if len(errors_list_str) > 5: print(f"  ... and {len(errors_list_str) - 5} more.")
-    print(f"{'='*60}")
+                lines += ["", f"{error_type} ({len(errors_list_str)}):"]
+                lines.extend(f"  - {item_str}" for item_str in errors_list_str[:5])
+                if len(errors_list_str) > 5: lines.append(f"  ... and {len(errors_list_str) - 5} more.")
+    lines.append(_BANNER)
+    sys.stdout.write("\n".join(lines) + "\n") # Single write instead of one print() per line
+
+
+@functools.lru_cache(maxsize=1)
+def _populated_marker_dir() -> Path:
+    """Marker directory for the configured database, so one database's markers never apply to another."""
+    from config import JDBC_URL, DB_USER
+    target = hashlib.sha256(f"{DB_USER}@{JDBC_URL}".encode("utf-8")).hexdigest()[:16]
+    return _POPULATED_MARKER_DIR / target
+
+
+def is_fab_populated(fab: str) -> bool:
+    """Check the in-process set, then the on-disk marker left by a previous invocation."""
+    if fab in _populated_fabs: return True
+    if (_populated_marker_dir() / f"populated-{fab}").exists():
+        _populated_fabs.add(fab)
+        return True
+    return False
+
+
+def mark_fab_populated(fab: str):
+    """Record that population ran for this fab (marker write failures are non-fatal)."""
+    _populated_fabs.add(fab)
+    try:
+        _populated_marker_dir().mkdir(parents=True, exist_ok=True)
+        (_populated_marker_dir() / f"populated-{fab}").touch()
+    except OSError: pass
 
 
 def execute_run_with_config(config: RunConfig, db: Database) -> RunResult:
     """Execute a run with the given configuration. DB passed as arg."""
     # Initialize services
-    if config.approach == Approach.RANDOM and config.building_code:
+    if config.approach == Approach.RANDOM and config.building_code and not is_fab_populated(config.building_code):
         # SimplePopulationService might populate nw_nodes/links, not tb_toolsets/tb_equipments
         # This is okay if they serve different purposes.
         population_service = SimplePopulationService(db)
         population_service.populate_on_first_run(config.building_code) # For nw_ tables if needed
+        mark_fab_populated(config.building_code)
     
     run_service = RunService(db)
     path_service = PathService(db)
@@ -387,42 +443,58 @@ def execute_run_with_config(config: RunConfig, db: Database) -> RunResult:
     return run_service.execute_run(config, path_service, coverage_service, verbose=config.verbose_mode)
 
 
+def _build_random_config(args: argparse.Namespace, db: Database, execution_mode: ExecutionMode,
+                         run_id: str, started_at: datetime) -> RunConfig:
+    """Build the RunConfig for a RANDOM run from CLI arguments."""
+    verbose = execution_mode != ExecutionMode.UNATTENDED and args.verbose
+    fab_code = args.fab or ""
+    if not fab_code:
+        available_fabs = fetch_available_fabs(db)
+        fab_code = available_fabs[0] if available_fabs else "M16" # Fallback if DB empty or no specific fab
+        if verbose: print(f"No fab specified for RANDOM run, using default: {fab_code}")
+    
+    phase_enum = resolve_phase_input(args.phase)
+    return RunConfig.create_with_auto_tag(
+        run_id, Approach.RANDOM, determine_method(Approach.RANDOM, args.method, args.scenario_code),
+        args.coverage_target,
+        building_code=fab_code, # This is fab
+        toolset=args.toolset or "ALL",
+        phase=phase_enum.nominal if phase_enum else "",
+        phase_enum=phase_enum,
+        execution_mode=execution_mode,
+        verbose_mode=verbose,
+        started_at=started_at
+    )
+
+
+def _build_scenario_config(args: argparse.Namespace, db: Database, execution_mode: ExecutionMode,
+                           run_id: str, started_at: datetime) -> RunConfig:
+    """Build the RunConfig for a SCENARIO run from CLI arguments."""
+    return RunConfig.create_with_auto_tag(
+        run_id, Approach.SCENARIO, determine_method(Approach.SCENARIO, args.method, args.scenario_code), 0.0,
+        building_code=args.fab or "",
+        toolset=args.toolset or "",
+        scenario_code=args.scenario_code or "",
+        scenario_file=args.scenario_file or "",
+        execution_mode=execution_mode,
+        verbose_mode=(execution_mode != ExecutionMode.UNATTENDED and args.verbose),
+        started_at=started_at
+    )
+
+
+_CONFIG_BUILDERS = {Approach.RANDOM: _build_random_config, Approach.SCENARIO: _build_scenario_config}
+
+
 def main_flow(args: argparse.Namespace, execution_mode: ExecutionMode):
     """Core logic for default and unattended modes."""
-    db = Database()
+    run_id, started_at = str(uuid.uuid4()), datetime.now() # Generated once per flow and reused
+    db = Database(reuse=True) # Shared JDBC connection: repeated main() calls skip the JVM connect
     try:
         approach_enum = Approach(args.approach.upper())
         validate_approach_specific_args(approach_enum, args, verbose=(execution_mode != ExecutionMode.UNATTENDED and args.verbose))
         
-        # Determine fab (building_code)
-        fab_code = args.fab or ""
-        if approach_enum == Approach.RANDOM and not fab_code:
-            available_fabs = fetch_available_fabs(db)
-            if available_fabs: fab_code = available_fabs[0]
-            else: fab_code = "M16" # Fallback if DB empty or no specific fab
-            if execution_mode != ExecutionMode.UNATTENDED and args.verbose:
-                print(f"No fab specified for RANDOM run, using default: {fab_code}")
-        
-        # Determine method
-        method_enum = determine_method(approach_enum, args.method, args.scenario_code)
-        
-        # Normalize phase input for RANDOM runs
-        normalized_phase_str = normalize_phase_input(args.phase) if approach_enum == Approach.RANDOM else ""
-
-        run_config = RunConfig.create_with_auto_tag(
-            run_id=str(uuid.uuid4()),
-            approach=approach_enum,
-            method=method_enum,
-            coverage_target=args.coverage_target if approach_enum == Approach.RANDOM else 0.0,
-            building_code=fab_code, # This is fab
-            toolset=args.toolset or ("ALL" if approach_enum == Approach.RANDOM else ""),
-            phase=normalized_phase_str,
-            scenario_code=args.scenario_code or "",
-            scenario_file=args.scenario_file or "",
-            execution_mode=execution_mode,
-            verbose_mode=(execution_mode != ExecutionMode.UNATTENDED and args.verbose),
-            started_at=datetime.now()
-        )
+        build_config = _CONFIG_BUILDERS[approach_enum]
+        run_config = build_config(args, db, execution_mode, run_id, started_at)
 
         if execution_mode == ExecutionMode.UNATTENDED:
             result = execute_run_with_config(run_config, db)
@@ -432,8 +504,8 @@ def main_flow(args: argparse.Namespace, execution_mode: ExecutionMode):
         # Default mode execution
         if args.verbose: print_configuration_summary(run_config)
         else:
-            run_type_msg = f"{approach_enum.value} ({method_enum.value})"
-            target_msg = f"for {fab_code}, target: {run_config.coverage_target:.1%}" if approach_enum == Approach.RANDOM else f"with scenario {run_config.scenario_code or run_config.scenario_file}"
+            run_type_msg = f"{approach_enum.value} ({run_config.method.value})"
+            target_msg = f"for {run_config.building_code}, target: {run_config.coverage_target:.1%}" if approach_enum == Approach.RANDOM else f"with scenario {run_config.scenario_code or run_config.scenario_file}"
             print(f"Starting {run_type_msg} analysis {target_msg}...")
         
         result = execute_run_with_config(run_config, db)
@@ -460,10 +532,10 @@ def main_flow(args: argparse.Namespace, execution_mode: ExecutionMode):
 
 def interactive_mode():
     """Run the application in interactive mode."""
-    print("=" * 60 + "\nPATH ANALYSIS CLI TOOL - INTERACTIVE MODE\n" + "=" * 60)
+    print(f"{_BANNER}\nPATH ANALYSIS CLI TOOL - INTERACTIVE MODE\n{_BANNER}")
     print("Welcome! This tool will guide you through setting up a path analysis run.")
     
-    db = Database()
+    db = Database(reuse=True) # Shared JDBC connection: repeated main() calls skip the JVM connect
     try:
         # 1. Approach
         approach_str = fetch_user_choice("Select analysis approach:", [e.value for e in Approach], 0)
@@ -513,20 +585,21 @@ def interactive_mode():
                 method_enum = Method.PREDEFINED 
 
         # Normalize phase if provided
-        normalized_phase_str = normalize_phase_input(phase_str_input)
+        phase_enum = resolve_phase_input(phase_str_input)
 
         # 4. Verbose
         verbose_str = fetch_user_choice("\nEnable verbose output?", ["No", "Yes"], 0)
         verbose_bool = verbose_str == "Yes"
 
-        # 5. Config
+        # 5. Config (timestamp taken after the prompts so started_at reflects the run, not the session)
+        run_id, started_at = str(uuid.uuid4()), datetime.now()
         run_config = RunConfig.create_with_auto_tag(
-            run_id=str(uuid.uuid4()), approach=approach_enum, method=method_enum,
-            coverage_target=coverage_target_val, building_code=fab_code,
-            toolset=toolset_str, phase=normalized_phase_str,
+            run_id, approach_enum, method_enum, coverage_target_val,
+            building_code=fab_code,
+            toolset=toolset_str, phase=phase_enum.nominal if phase_enum else "", phase_enum=phase_enum,
             scenario_code=scenario_code_str, scenario_file=scenario_file_str,
             execution_mode=ExecutionMode.INTERACTIVE, verbose_mode=verbose_bool,
-            started_at=datetime.now()
+            started_at=started_at
         )
         
         print_configuration_summary(run_config)
@@ -12,7 +12,7 @@ from enums import (
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RunConfig:
     """Configuration for a single analysis run."""
     run_id: str
@@ -28,13 +28,15 @@ class RunConfig:
     scenario_file: str = ""
     execution_mode: ExecutionMode = ExecutionMode.DEFAULT
     verbose_mode: bool = False
+    phase_enum: Optional[Phase] = None  # Resolved Phase member for display (PHASE1), avoids re-normalizing
     
     @classmethod
     def create_with_auto_tag(cls, run_id: str, approach: Approach, method: Method,
                            coverage_target: float, building_code: str = "", toolset: str = "",
                            phase: str = "", scenario_code: str = "", scenario_file: str = "",
                            execution_mode: ExecutionMode = ExecutionMode.DEFAULT,
-                           verbose_mode: bool = False, started_at: datetime = None) -> 'RunConfig':
+                           verbose_mode: bool = False, started_at: datetime = None,
+                           phase_enum: Optional[Phase] = None) -> 'RunConfig':
         """Create a RunConfig with automatically generated tag."""
         if started_at is None:
             started_at = datetime.now()
@@ -55,7 +57,8 @@ class RunConfig:
             scenario_code=scenario_code,
             scenario_file=scenario_file,
             execution_mode=execution_mode,
-            verbose_mode=verbose_mode
+            verbose_mode=verbose_mode,
+            phase_enum=phase_enum
         )
     
     @staticmethod